@@ -18,6 +18,9 @@ def main() -> None:
     # Create oracle instance (shared across strategies)
     oracle = RandomUniformOracle()
 
+    # Snapshot settings once (shared across strategies)
+    settings_snapshot = settings.model_dump()
+
     batches = []
 
     # Benchmark 1: Random Consistent
@@ -30,7 +33,7 @@ def main() -> None:
         strategy_name="Random Consistent",
         game_settings=settings.game,
         path_settings=settings.path,
-        settings_snapshot=settings.model_dump(),
+        settings_snapshot=settings_snapshot,
     )
     batches.append(batch_consistent)
 
@@ -45,7 +48,7 @@ def main() -> None:
         strategy_name="Random Uniform",
         game_settings=settings.game,
         path_settings=settings.path,
-        settings_snapshot=settings.model_dump(),
+        settings_snapshot=settings_snapshot,
     )
     batches.append(batch_uniform)
 
@@ -1,14 +1,28 @@
-from logging import getLogger
+from logging import DEBUG, getLogger
 from time import perf_counter_ns
+from typing import List
+
+from numpy import (
+    arange,
+    argsort,
+    array,
+    asarray,
+    count_nonzero,
+    full,
+    ndarray,
+    uint8,
+    zeros,
+)
 
 from solver.oracle.base import Oracle
-from solver.game.feedback import (
-    build_feedback_decode_table,
-    build_feedback_encode_table,
-)
+from solver.game.feedback import FEEDBACK_DECODE_TABLE, build_feedback_encode_table
 from solver.game.result import GameResult
-from solver.game.state import GameState
-from solver.utility.io.cache import get_cache_key, load_from_cache, save_to_cache
+from solver.game.state import WIN_FEEDBACK, GameState
+from solver.utility.io.cache import (
+    get_cache_key,
+    load_array_from_cache,
+    save_array_to_cache,
+)
 from solver.utility.io.load_data import load_words
 from solver.strategy.base import Solver
 from solver.settings.game import GameSettings
@@ -54,53 +68,55 @@ class GameEngine:
         self.solver = solver
 
         # Initialize state
-        self.state = GameState()
+        self.state = GameState(max_turns=self.settings.max_turns)
         self.state.valid_words = load_words(self.paths.valid_words_csv)
         self.state.word_bank = load_words(self.paths.word_bank_csv)
-        self.state.max_turns = self.settings.max_turns
 
-        # Build index dictionaries
-        self.state.word_bank_index = self._build_index_dictionary(self.state.word_bank)
-        self.state.valid_word_index = self._build_index_dictionary(
+        # Build word lookups
+        self._build_word_bank_lookup()
+        self.state.valid_word_bank_index = self.state.word_bank_indices(
             self.state.valid_words
-        )
+        ).tolist()
 
         # Build feedback tables
         self._build_feedback_tables()
 
         logger.debug("Game engine initialized.")
 
-    def play_turn(self) -> tuple[str, int]:
+    def play_turn(self) -> tuple[int, int]:
         """
         Execute a single solver turn.
 
         Returns:
-            tuple[str, int]: The guess and encoded feedback.
+            tuple[int, int]: The guess index in the word bank and encoded feedback.
         """
         if self.state.terminal:
             logger.error("Cannot play turn: game has already terminated.")
             raise RuntimeError("Cannot play turn: game has already terminated.")
 
-        if self.state.answer is None:
+        if self.state.answer_index is None:
             raise RuntimeError("Cannot play turn: hidden answer has not been set.")
 
-        guess = self.solver.guess(self.state)
-
-        guess_index = self.state.word_bank_index[guess]
-        answer_index = self.state.valid_word_index[self.state.answer]
+        guess_index = self.solver.guess(self.state)
 
-        feedback = self.state.feedback_encode_table[guess_index][answer_index]
+        feedback = self.state.feedback_encode_view[guess_index, self.state.answer_index]
 
-        self.state.history.append((guess, feedback))
+        self.state.history[self.state.turn_count] = (guess_index, feedback)
+        self.state.turn_count += 1
 
-        logger.debug(
-            f"Turn {len(self.state.history)}: Guess='{guess}', "
-            f"Feedback='{self.state.feedback_decode_table[feedback]}'"
-        )
+        # Skip building the message when debug logging is disabled
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(
+                f"Turn {self.state.turn_count}: "
+                f"Guess='{self.state.word_bank[guess_index]}', "
+                f"Feedback='{self.state.feedback_decode_table[feedback]}'"
+            )
 
-        return guess, feedback
+        return guess_index, feedback
 
-    def run(self, random_seed: int | None = None) -> GameResult:
+    def run(
+        self, random_seed: int | None = None, answer_index: int | None = None
+    ) -> GameResult:
         """
         Execute the game until termination.
 
@@ -109,11 +125,13 @@ class GameEngine:
 
         Args:
             random_seed: Optional seed value for reproducibility tracking.
+            answer_index: Optional index in valid_words of a preselected hidden
+                answer. If None, the chooser selects one.
 
         Returns:
             GameResult: Immutable record of the completed game.
         """
-        self.reset()
+        self.reset(answer_index)
         logger.debug("Starting game execution.")
 
         # Track execution time
@@ -125,69 +143,180 @@ class GameEngine:
         end_time = perf_counter_ns()
         duration_ns = end_time - start_time
 
-        if self.state.won:
-            logger.debug(f"Game won in {len(self.state.history)} turns.")
-        else:
-            logger.debug(f"Game lost. The answer was '{self.state.answer}'.")
+        if logger.isEnabledFor(DEBUG):
+            if self.state.won:
+                logger.debug(f"Game won in {self.state.turn_count} turns.")
+            else:
+                logger.debug(f"Game lost. The answer was '{self.state.answer}'.")
 
         # Build and return immutable result
         return GameResult(
             answer=self.state.answer or "UNKNOWN",
             won=self.state.won,
-            guesses=[guess for guess, _ in self.state.history],
+            guesses=[
+                self.state.word_bank[guess]
+                for guess in self.state.history[: self.state.turn_count, 0].tolist()
+            ],
             duration_ns=duration_ns,
             random_seed=random_seed,
         )
 
-    def reset(self) -> None:
+    def run_batch(
+        self, random_seeds: List[int], answer_indices: ndarray | None = None
+    ) -> List[GameResult]:
+        """
+        Execute many games at once with a stateless solver.
+
+        Instead of playing each game turn by turn, every turn draws one guess
+        for each game still in progress and looks up all of their feedback
+        with a single gather on the feedback table. The shared game state is
+        not modified.
+
+        Per-game durations are not measurable in this mode, so the total
+        batch time is split evenly across games.
+
+        Args:
+            random_seeds: Seed value recorded for each game, one per game.
+            answer_indices: Optional indices in valid_words of preselected hidden
+                answers, one per game. If None, the chooser selects them.
+
+        Returns:
+            List[GameResult]: Immutable records of the completed games.
+
+        Raises:
+            ValueError: If the solver is not stateless.
+        """
+        if not self.solver.stateless:
+            raise ValueError(
+                f"Cannot run batch: {type(self.solver).__name__} is not stateless."
+            )
+
+        number_of_games = len(random_seeds)
+        max_turns = self.state.max_turns
+
+        self.solver.reset()
+
+        if answer_indices is None:
+            answer_indices = self.chooser.choose_batch(
+                self.state.valid_words, number_of_games
+            )
+        answers = asarray(answer_indices)
+
+        # Guess indices per game and turn, -1 for turns that were not played
+        guesses = full((number_of_games, max_turns), -1)
+        won = zeros(number_of_games, dtype=bool)
+
+        start_time = perf_counter_ns()
+
+        in_progress = arange(number_of_games)
+        for turn in range(max_turns):
+            if not in_progress.size:
+                break
+
+            turn_guesses = self.solver.batch_guess(self.state, in_progress.size)
+            guesses[in_progress, turn] = turn_guesses
+
+            feedback = self.state.feedback_encode_table[
+                turn_guesses, answers[in_progress]
+            ]
+            solved = feedback == WIN_FEEDBACK
+
+            won[in_progress[solved]] = True
+            in_progress = in_progress[~solved]
+
+        end_time = perf_counter_ns()
+        duration_ns = (end_time - start_time) // max(number_of_games, 1)
+
+        logger.debug(f"Batch of {number_of_games} games completed.")
+
+        word_bank = self.state.word_bank
+        return [
+            GameResult(
+                answer=self.state.valid_words[answer],
+                won=game_won,
+                guesses=[word_bank[guess] for guess in game_guesses[:turns]],
+                duration_ns=duration_ns,
+                random_seed=random_seed,
+            )
+            for answer, game_won, game_guesses, turns, random_seed in zip(
+                answers.tolist(),
+                won.tolist(),
+                guesses.tolist(),
+                count_nonzero(guesses >= 0, axis=1).tolist(),
+                random_seeds,
+            )
+        ]
+
+    def reset(self, answer_index: int | None = None) -> None:
         """
         Reset the game state to start a new game.
 
         Keep the loaded word lists and settings, but select a new hidden answer,
         clear the guess history, and reset the solver if applicable.
+
+        Args:
+            answer_index: Optional index in valid_words of a preselected hidden
+                answer. If None, the chooser selects one.
         """
         logger.debug("Resetting game state and solver.")
-        self.state.history.clear()
-        self.state.answer = self.chooser.choose(self.state.valid_words)
-        logger.debug(f"New answer chosen: {self.state.answer}")
+        self.state.turn_count = 0
+
+        if answer_index is None:
+            answer_index = self.chooser.choose(self.state.valid_words)
+        self.state.answer_index = answer_index
+
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(f"New answer chosen: {self.state.answer}")
 
         self.solver.reset()
         logger.debug("Solver state reset.")
 
-    def _build_index_dictionary(self, word_list: list[str]) -> dict[str, int]:
+    def _build_word_bank_lookup(self) -> None:
         """
-        Build a dictionary mapping words to their indices in the provided list.
-
-        Args:
-            word_list: List of words to index.
-
-        Returns:
-            Dictionary mapping each word to its index.
+        Build the sorted word bank array and permutation used for index lookups.
         """
-        return {word: i for i, word in enumerate(word_list)}
+        words = array(self.state.word_bank)
+        self.state.word_bank_order = argsort(words, kind="stable")
+        self.state.word_bank_sorted = words[self.state.word_bank_order]
 
     def _build_feedback_tables(self) -> None:
         """
-        Build feedback encoding and decoding tables, using cached versions if available.
+        Build feedback encoding and decoding tables, using a cached encoding
+        table if available.
+
+        The cached encoding table is memory-mapped read-only, so it must not be
+        mutated. A cached table that is not a C-contiguous uint8 array of shape
+        (word bank size, valid words size) is ignored and rebuilt. The decoding
+        table is a module-level constant shared by all engines.
         """
         cache_key = get_cache_key(self.paths.word_bank_csv, self.paths.valid_words_csv)
-        cached_tables = load_from_cache(self.paths.cache_folder, cache_key)
-
-        if cached_tables is not None:
-            logger.debug("Loading feedback tables from cache.")
-            self.state.feedback_encode_table, self.state.feedback_decode_table = (
-                cached_tables
-            )
+        cached_table = load_array_from_cache(self.paths.cache_folder, cache_key)
+
+        # Solvers rely on a contiguous uint8 row per guess, so any cached table
+        # in another layout is rebuilt rather than used
+        expected_shape = (len(self.state.word_bank), len(self.state.valid_words))
+        if cached_table is not None and not (
+            cached_table.dtype == uint8
+            and cached_table.shape == expected_shape
+            and cached_table.flags.c_contiguous
+        ):
+            logger.warning("Cached feedback encode table has an invalid layout.")
+            cached_table = None
+
+        if cached_table is not None:
+            logger.debug("Loading feedback encode table from cache.")
+            self.state.feedback_encode_table = cached_table
 
         else:
             logger.debug("Building feedback tables (this may take a moment)...")
             self.state.feedback_encode_table = build_feedback_encode_table(
                 self.state.word_bank, self.state.valid_words
             )
-            self.state.feedback_decode_table = build_feedback_decode_table()
-            save_to_cache(
-                self.paths.cache_folder,
-                cache_key,
-                (self.state.feedback_encode_table, self.state.feedback_decode_table),
+            save_array_to_cache(
+                self.paths.cache_folder, cache_key, self.state.feedback_encode_table
             )
-            logger.debug("Feedback tables cached for future use.")
+            logger.debug("Feedback encode table cached for future use.")
+
+        # Scalar lookups through a memoryview yield Python ints without copying
+        self.state.feedback_encode_view = memoryview(self.state.feedback_encode_table)
+        self.state.feedback_decode_table = FEEDBACK_DECODE_TABLE
@@ -1,94 +1,125 @@
+from concurrent.futures import ThreadPoolExecutor
+from os import process_cpu_count
 from typing import List
 
-from numpy import ndarray, uint8, zeros
+from numpy import (
+    add,
+    arange,
+    array,
+    bool_,
+    empty,
+    equal,
+    flatnonzero,
+    frombuffer,
+    less,
+    logical_and,
+    logical_not,
+    multiply,
+    ndarray,
+    uint8,
+)
 
 
 # Precomputed powers of three to avoid the exponentiation operation
 _POWERS_OF_THREE = [1, 3, 9, 27, 81]
 
+# Number of guess rows encoded per vectorized block, keeping the intermediate
+# (block, answers) boolean masks small enough to stay in cache
+_TABLE_BLOCK_SIZE = 256
 
-def _encode_feedback(guess: str, answer: str) -> int:
-    """
-    Encode Wordle feedback between a guess and an answer into a base-3 integer.
-
-    The encoding represents the feedback for each letter position using a
-    ternary system:
-        - 0 -> Absent: The letter does not appear in the answer or exceeds the
-          number of occurrences allowed by previous matches.
-        - 1 -> Present: The letter exists in the answer but in a different
-          position, respecting duplicate letter rules.
-        - 2 -> Correct: The letter matches the answer at the same position.
+# Most threads used to build the table. Each thread holds about 20 MB of block
+# scratch, so peak memory stays bounded on hosts with many CPUs
+_MAX_TABLE_THREADS = 4
 
-    The final encoded integer is constructed as:
 
-        sum(feedback[i] * 3**i for i in range(5))
-
-    This ensures a unique mapping for all possible Wordle feedback patterns.
+def _encode_words(words: List[str]) -> ndarray:
+    """
+    Convert a list of 5-letter lowercase words into a letter index matrix.
 
     Args:
-        guess (str): The guessed 5-letter lowercase word.
-        answer (str): The target 5-letter lowercase word.
+        words (List[str]): List of 5-letter lowercase words.
 
     Returns:
-        int: Encoded feedback value in the range [0, 242].
+        ndarray:
+            A ``uint8`` array of shape ``(len(words), 5)`` where each entry is
+            the alphabet index of the letter (``'a'`` -> 0, ``'z'`` -> 25).
     """
+    letters = frombuffer("".join(words).encode("ascii"), dtype=uint8)
+    return letters.reshape(-1, 5) - 97
 
-    counts = [0] * 26
-    for character in answer:
-        counts[ord(character) - 97] += 1
-
-    result = 0
-    used = [0] * 5
-
-    # First pass — Correct position (green)
-    for i in range(5):
-        if guess[i] == answer[i]:
-            index = ord(guess[i]) - 97
-            counts[index] -= 1
-            used[i] = 2
-            result += 2 * _POWERS_OF_THREE[i]
 
-    # Second pass — Present but misplaced (yellow)
-    for i in range(5):
-        if used[i]:
-            continue
-
-        index = ord(guess[i]) - 97
-
-        if counts[index] > 0:
-            counts[index] -= 1
-            result += 1 * _POWERS_OF_THREE[i]
-
-    return result
+def _fill_feedback_table(guesses: ndarray, answers: ndarray, out: ndarray) -> None:
+    """
+    Encode the feedback for every guess and answer pair into a preallocated table.
 
+    Each feedback pattern is a base-3 integer,
+    ``sum(feedback[i] * 3**i for i in range(5))``, with 0 for absent, 1 for
+    present and 2 for correct letters. Greens are positional matches. A guess letter at position ``i`` that is not green is
+    yellow when the number of non-green answer positions holding that letter
+    exceeds the number of earlier non-green guess positions that already
+    claimed it, which reproduces the left-to-right duplicate letter rules.
 
-def _decode_feedback(feedback: uint8) -> str:
-    """
-    Decode a Wordle feedback integer into its positional feedback string.
+    Guesses are processed in blocks of ``_TABLE_BLOCK_SIZE`` rows. The
+    intermediate masks and counters are allocated once and reused for every
+    block, and results are accumulated directly into ``out``.
 
     Args:
-        feedback (uint8): Encoded feedback value in the range [0, 242].
-
-    Returns:
-        str:
-            A 5-character string representing positional feedback using:
-            'A' for absent, 'P' for present, and 'C' for correct.
+        guesses (ndarray): Letter index matrix of shape ``(G, 5)``.
+        answers (ndarray): Letter index matrix of shape ``(A, 5)``.
+        out (ndarray): Output table of shape ``(G, A)`` with dtype ``uint8``.
     """
-    result = [""] * 5
-
-    for i in range(5):
-        digit = feedback % 3
-
-        if digit == 2:
-            result[i] = "C"
-        elif digit == 1:
-            result[i] = "P"
-        else:
-            result[i] = "A"
-
-        feedback //= 3
-
-    return "".join(result)
+    block_shape = (min(_TABLE_BLOCK_SIZE, guesses.shape[0]), answers.shape[0])
+
+    # matches[i, j]: guess letter i equals answer letter j
+    matches_buffer = empty((5, 5, *block_shape), dtype=bool_)
+    not_green_buffer = empty((5, *block_shape), dtype=bool_)
+    mask_buffer = empty(block_shape, dtype=bool_)
+    available_buffer = empty(block_shape, dtype=uint8)
+    claimed_buffer = empty(block_shape, dtype=uint8)
+    digit_buffer = empty(block_shape, dtype=uint8)
+
+    for start in range(0, guesses.shape[0], _TABLE_BLOCK_SIZE):
+        block = guesses[start : start + _TABLE_BLOCK_SIZE]
+        rows = block.shape[0]
+
+        result = out[start : start + rows]
+        matches = matches_buffer[:, :, :rows]
+        not_green = not_green_buffer[:, :rows]
+        mask = mask_buffer[:rows]
+        available = available_buffer[:rows]
+        claimed = claimed_buffer[:rows]
+        digit = digit_buffer[:rows]
+
+        for i in range(5):
+            for j in range(5):
+                equal(block[:, i, None], answers[None, :, j], out=matches[i, j])
+            logical_not(matches[i, i], out=not_green[i])
+
+        result.fill(0)
+
+        for i in range(5):
+            multiply(matches[i, i].view(uint8), 2 * _POWERS_OF_THREE[i], out=digit)
+            add(result, digit, out=result)
+
+            # Unmatched answer positions holding the guess letter at position i
+            available.fill(0)
+            for j in range(5):
+                if j != i:
+                    logical_and(matches[i, j], not_green[j], out=mask)
+                    add(available, mask.view(uint8), out=available)
+
+            # Earlier unmatched guess positions with the same letter claim first.
+            # Only guesses repeating a letter can claim, so restrict to those rows
+            claimed.fill(0)
+            for k in range(i):
+                repeated = flatnonzero(block[:, k] == block[:, i])
+                if repeated.size:
+                    claimed[repeated] += not_green[k, repeated]
+
+            less(claimed, available, out=mask)
+            logical_and(mask, not_green[i], out=mask)
+            multiply(mask.view(uint8), _POWERS_OF_THREE[i], out=digit)
+            add(result, digit, out=result)
 
 
 def build_feedback_encode_table(
@@ -101,25 +132,52 @@ def build_feedback_encode_table(
     guessed word and valid answer word. The resulting matrix allows constant-time
     retrieval of feedback during solver execution.
 
+    Both word lists are converted once to contiguous letter index matrices,
+    and the table is filled in place by a vectorized NumPy kernel instead of
+    encoding each pair individually in Python. Rows are split into contiguous
+    slices filled by one thread per available CPU, up to _MAX_TABLE_THREADS,
+    since the NumPy operations release the GIL.
+
     Args:
         word_bank (List[str]): List of all allowed guess words.
         valid_words (List[str]): List of all valid answer words.
 
     Returns:
         ndarray:
-            A two-dimensional NumPy array of shape
+            A two-dimensional C-contiguous NumPy array of shape
             ``(len(word_bank), len(valid_words))`` with dtype ``uint8``
-            for memory optimization.
+            for memory optimization. Each guess row is contiguous, matching
+            solvers that scan one guess against many answers.
     """
 
-    number_of_guesses = len(word_bank)
-    number_of_answers = len(valid_words)
+    table = empty((len(word_bank), len(valid_words)), dtype=uint8)
 
-    table = zeros((number_of_guesses, number_of_answers), dtype=uint8)
+    # Nothing to fill, and no rows to split into slices
+    if not table.size:
+        return table
 
-    for guess_index, guess in enumerate(word_bank):
-        for answer_index, answer in enumerate(valid_words):
-            table[guess_index, answer_index] = _encode_feedback(guess, answer)
+    guesses = _encode_words(word_bank)
+    answers = _encode_words(valid_words)
+
+    # Split rows into one slice per worker, aligned to whole blocks
+    number_of_blocks = -(-len(word_bank) // _TABLE_BLOCK_SIZE)
+    number_of_workers = min(
+        process_cpu_count() or 1, _MAX_TABLE_THREADS, number_of_blocks
+    )
+    slice_size = -(-number_of_blocks // number_of_workers) * _TABLE_BLOCK_SIZE
+
+    def fill_slice(start: int) -> None:
+        stop = start + slice_size
+        _fill_feedback_table(guesses[start:stop], answers, table[start:stop])
+
+    starts = range(0, len(word_bank), slice_size)
+
+    if number_of_workers == 1:
+        fill_slice(0)
+    else:
+        with ThreadPoolExecutor(max_workers=number_of_workers) as executor:
+            # Consume the results so that worker exceptions are raised here
+            list(executor.map(fill_slice, starts))
 
     return table
 
@@ -136,9 +194,9 @@ def build_feedback_decode_table() -> List[str]:
 
     possible feedback values.
 
-    This function precomputes the decoding for every possible encoded
-    feedback integer, allowing constant-time lookup instead of repeated
-    decoding computations.
+    The base-3 digits of every encoded value are extracted at once with NumPy
+    and mapped to 'A' for absent, 'P' for present and 'C' for correct,
+    allowing constant-time lookup instead of repeated decoding computations.
 
     Returns:
         List[str]:
@@ -146,9 +204,11 @@ def build_feedback_decode_table() -> List[str]:
             5-character feedback string corresponding to encoded value ``i``.
     """
 
-    table: List[str] = [""] * 243
+    digits = (arange(243)[:, None] // array(_POWERS_OF_THREE)) % 3
+    symbols = array(["A", "P", "C"])
 
-    for i in range(243):
-        table[i] = _decode_feedback(uint8(i))
+    return ["".join(row) for row in symbols[digits]]
 
-    return table
+
+# Decoding table shared by every engine, built once per process
+FEEDBACK_DECODE_TABLE: List[str] = build_feedback_decode_table()
@@ -1,40 +1,76 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional
 
-from numpy import ndarray
+from numpy import array, empty, int32, ndarray, searchsorted
 
 
 WIN_FEEDBACK: int = 242
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     """
     Canonical Wordle game state.
 
     Attributes:
-        history (List[Tuple[str, int]]): Ordered list of (guess, encoded_feedback) pairs.
-        answer (Optional[str]): Hidden answer word determined by the chooser.
+        history (ndarray): ``(max_turns, 2)`` array allocated on construction,
+            whose first ``turn_count`` rows hold the (guess_index,
+            encoded_feedback) pairs played so far, where guess_index points
+            into word_bank.
+        turn_count (int): Number of guesses already made.
+        answer_index (Optional[int]): Index in valid_words of the hidden answer
+            determined by the chooser.
         word_bank (List[str]): List of all allowed guess words.
         valid_words (List[str]): List of all current valid answer words.
         max_turns (int): Maximum number of guesses allowed.
-        feedback_encode_table (Optional[ndarray]): Precomputed table mapping
-            (guess_index, answer_index) to encoded feedback.
-        feedback_decode_table (Optional[dict[int, str]]): Precomputed mapping from
+        feedback_encode_table (Optional[ndarray]): Precomputed row-major table
+            mapping (guess_index, answer_index) to encoded feedback. Consumers
+            should index whole guess rows, which are contiguous. May be a
+            read-only memory map, so it must not be mutated.
+        feedback_encode_view (Optional[memoryview]): Zero-copy view of
+            feedback_encode_table for scalar lookups, which return plain
+            Python ints instead of NumPy scalars.
+        feedback_decode_table (Optional[List[str]]): Precomputed mapping from
             encoded feedback values to human-readable feedback strings.
-        word_bank_index (Dict[str, int]): Mapping from word to its index in word_bank.
-        valid_word_index (Dict[str, int]): Mapping from word to its index in valid_words.
+        word_bank_sorted (Optional[ndarray]): Alphabetically sorted array of the
+            word_bank words, used for binary search lookups.
+        word_bank_order (Optional[ndarray]): Permutation such that
+            ``word_bank_order[i]`` is the word_bank index of ``word_bank_sorted[i]``.
+        valid_word_bank_index (List[int]): Index in word_bank of each word in
+            valid_words, used to submit answer candidates as guesses.
     """
 
-    history: List[Tuple[str, int]] = field(default_factory=list)
-    answer: Optional[str] = None
+    history: ndarray = field(init=False)
+    turn_count: int = 0
+    answer_index: Optional[int] = None
     word_bank: List[str] = field(default_factory=list)
     valid_words: List[str] = field(default_factory=list)
     max_turns: int = 6
     feedback_encode_table: Optional[ndarray] = None
-    feedback_decode_table: Optional[dict[int, str]] = None
-    word_bank_index: Dict[str, int] = field(default_factory=dict)
-    valid_word_index: Dict[str, int] = field(default_factory=dict)
+    feedback_encode_view: Optional[memoryview] = None
+    feedback_decode_table: Optional[List[str]] = None
+    word_bank_sorted: Optional[ndarray] = None
+    word_bank_order: Optional[ndarray] = None
+    valid_word_bank_index: List[int] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        """
+        Allocate the guess history with one row per allowed turn.
+        """
+        self.history = empty((self.max_turns, 2), dtype=int32)
+
+    @property
+    def answer(self) -> Optional[str]:
+        """
+        Hidden answer word, resolved from its index for display purposes.
+
+        Returns:
+            Optional[str]: The answer word, or None if no answer has been set.
+        """
+        if self.answer_index is None:
+            return None
+
+        return self.valid_words[self.answer_index]
 
     @property
     def turn(self) -> int:
@@ -44,7 +80,7 @@ class GameState:
         Returns:
             int: Number of guesses already made.
         """
-        return len(self.history)
+        return self.turn_count
 
     @property
     def remaining_turns(self) -> int:
@@ -66,13 +102,11 @@ class GameState:
                 True if the puzzle has been solved or if the maximum
                 number of turns has been reached, otherwise False.
         """
-        if not self.history:
+        if not self.turn_count:
             return False
 
-        _, last_feedback = self.history[-1]
-
-        solved = last_feedback == WIN_FEEDBACK
-        out_of_turns = self.turn >= self.max_turns
+        solved = self.history[self.turn_count - 1, 1].item() == WIN_FEEDBACK
+        out_of_turns = self.turn_count >= self.max_turns
 
         return solved or out_of_turns
 
@@ -84,8 +118,35 @@ class GameState:
         Returns:
             bool: True if the last guess matched the answer, otherwise False.
         """
-        if not self.history:
+        if not self.turn_count:
             return False
 
-        _, last_feedback = self.history[-1]
-        return last_feedback == WIN_FEEDBACK
+        return self.history[self.turn_count - 1, 1].item() == WIN_FEEDBACK
+
+    def word_bank_indices(self, words: List[str]) -> ndarray:
+        """
+        Look up the word_bank indices of many words at once.
+
+        Words are located with a vectorized binary search over the sorted word
+        bank, avoiding a dictionary entry per word.
+
+        Args:
+            words (List[str]): Words to look up.
+
+        Returns:
+            ndarray: Index in word_bank of each word, in the order given.
+
+        Raises:
+            ValueError: If any of the words is not in the word bank.
+        """
+        queries = array(words)
+        positions = searchsorted(self.word_bank_sorted, queries)
+        positions[positions == len(self.word_bank_sorted)] = 0
+
+        missing = self.word_bank_sorted[positions] != queries
+        if missing.any():
+            raise ValueError(
+                f"Words not found in the word bank: {queries[missing].tolist()}"
+            )
+
+        return self.word_bank_order[positions]
@@ -1,5 +1,9 @@
+from contextlib import contextmanager
 from logging import Logger, StreamHandler, getLogger, WARNING
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing import Queue
 from sys import stdout
+from typing import Iterator, Tuple
 
 from solver.logging.format import get_formatter
 from solver.settings.logging import LoggingSettings
@@ -38,3 +42,42 @@ def get_logger(settings: LoggingSettings) -> Logger:
         library_logger.setLevel(WARNING)
 
     return logger
+
+
+@contextmanager
+def forward_worker_logs() -> Iterator[Tuple[Queue, int]]:
+    """
+    Emit the log records of worker processes through this process's handlers.
+
+    Workers started with spawn or forkserver do not inherit the logging
+    configuration, so each pool worker should call initialize_worker_logging
+    with the yielded queue and level. The listener is stopped, and every queued
+    record emitted, when the context exits.
+
+    Yields:
+        Tuple[Queue, int]: Queue read by the listener and the level of the root
+            logger, the arguments of initialize_worker_logging.
+    """
+    root = getLogger()
+    log_queue = Queue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    listener.start()
+
+    try:
+        yield log_queue, root.level
+    finally:
+        listener.stop()
+
+
+def initialize_worker_logging(log_queue: Queue, level: int) -> None:
+    """
+    Route the log records of a worker process to the parent process.
+
+    Args:
+        log_queue (Queue): Queue read by the parent's forward_worker_logs listener.
+        level (int): Level of the parent's root logger.
+    """
+    root = getLogger()
+    root.handlers.clear()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
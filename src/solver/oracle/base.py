@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import List
 
+from numpy import fromiter, int64, ndarray
+
 
 class Oracle(ABC):
     """
@@ -12,18 +14,41 @@ class Oracle(ABC):
     evaluation and experimentation.
     """
 
+    __slots__ = ()
+
     @abstractmethod
-    def choose(self, valid_words: List[str]) -> str:
+    def choose(self, valid_words: List[str]) -> int:
         """
-        Select and return one target word from the available pool.
+        Select one target word from the available pool and return its index.
 
         Args:
             valid_words: List of words eligible to be selected as the target.
 
         Returns:
-            A string representing the selected target word.
+            The index in valid_words of the selected target word.
 
         Raises:
             ValueError: If the valid_words list is empty.
         """
         ...
+
+    def choose_batch(self, valid_words: List[str], size: int) -> ndarray:
+        """
+        Select target words for many games at once and return their indices.
+
+        The default implementation calls ``choose`` once per game. Oracles that
+        can draw all targets in a single operation should override it.
+
+        Args:
+            valid_words: List of words eligible to be selected as the target.
+            size: Number of targets to select.
+
+        Returns:
+            An array with the index in valid_words of each selected target word.
+
+        Raises:
+            ValueError: If the valid_words list is empty.
+        """
+        return fromiter(
+            (self.choose(valid_words) for _ in range(size)), dtype=int64, count=size
+        )
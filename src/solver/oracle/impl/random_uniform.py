@@ -1,6 +1,8 @@
-from random import Random
 from typing import List, Optional
 
+from numpy import int64, ndarray
+from numpy.random import Generator, default_rng
+
 from solver.oracle.base import Oracle
 
 
@@ -12,6 +14,8 @@ class RandomUniformOracle(Oracle):
     This is the assumed classic way to choose a target.
     """
 
+    __slots__ = ("rng",)
+
     def __init__(self, rng_seed: Optional[int] = None) -> None:
         """
         Initialize the oracle with optional deterministic randomness.
@@ -21,19 +25,41 @@ class RandomUniformOracle(Oracle):
                 generator for reproducible selections.
         """
         super().__init__()
-        self.random: Random = Random(rng_seed)
+        self.rng: Generator = default_rng(rng_seed)
 
-    def choose(self, valid_words: List[str]) -> str:
+    def choose(self, valid_words: List[str]) -> int:
         """
-        Randomly select and return one target word.
+        Randomly select one target word and return its index.
 
         Args:
             valid_words: List of words eligible to be selected as the target.
 
         Returns:
-            A randomly selected word from the valid word pool.
+            The index of a randomly selected word from the valid word pool.
+
+        Raises:
+            ValueError: If the valid_words list is empty.
+        """
+        if not valid_words:
+            raise ValueError("Cannot choose a target word from an empty list.")
+
+        return int(self.rng.integers(len(valid_words)))
+
+    def choose_batch(self, valid_words: List[str], size: int) -> ndarray:
+        """
+        Randomly select target words for many games in a single draw.
+
+        Args:
+            valid_words: List of words eligible to be selected as the target.
+            size: Number of targets to select.
+
+        Returns:
+            An array with the index of each randomly selected target word.
+
+        Raises:
+            ValueError: If the valid_words list is empty.
         """
         if not valid_words:
             raise ValueError("Cannot choose a target word from an empty list.")
 
-        return self.random.choice(valid_words)
+        return self.rng.integers(len(valid_words), size=size, dtype=int64)
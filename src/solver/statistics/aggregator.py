@@ -1,9 +1,71 @@
-from collections import Counter
-from math import log2
-from statistics import mean, median, stdev
-from typing import Dict, List
+from itertools import compress
+from typing import Dict, List, Tuple
 
-from solver.statistics.models import PerformanceMetrics, BenchmarkBatch
+from numpy import (
+    add,
+    arange,
+    array,
+    bincount,
+    bool_,
+    fromiter,
+    int64,
+    lexsort,
+    log2,
+    logical_not,
+    maximum,
+    median,
+    ndarray,
+    repeat,
+    sqrt,
+    uint32,
+    unique,
+    zeros,
+)
+
+from solver.statistics.models import (
+    BenchmarkBatch,
+    GuessCountStatistics,
+    PerformanceMetrics,
+)
+
+
+def count_failure_letters(failed_words: List[str]) -> Tuple[List[str], ndarray]:
+    """
+    Count how often each letter appears at each position of the failed words.
+
+    Words are laid out as rows of a fixed-width Unicode array, padded with NUL
+    up to the longest word, so every character of every word is counted in a
+    single bincount over (letter, position) pairs.
+
+    Args:
+        failed_words (List[str]): List of words that resulted in losses.
+
+    Returns:
+        Tuple[List[str], ndarray]: The lowercase letters that occur, in code
+            point order, and an array of shape (letters, positions) with the
+            count of each letter at each position.
+    """
+    if not failed_words:
+        return [], zeros((0, 0), dtype=int64)
+
+    words = array([word.lower() for word in failed_words])
+    codes = words.view(uint32).reshape(len(failed_words), -1)
+    word_length = codes.shape[1]
+
+    letter_codes, letter_indices = unique(codes, return_inverse=True)
+    counts = bincount(
+        (
+            letter_indices.reshape(codes.shape) * word_length + arange(word_length)
+        ).ravel(),
+        minlength=letter_codes.size * word_length,
+    ).reshape(letter_codes.size, word_length)
+
+    # Skip the padding code, which sorts first whenever a word is shorter
+    if letter_codes[0] == 0:
+        letter_codes = letter_codes[1:]
+        counts = counts[1:]
+
+    return [chr(code) for code in letter_codes.tolist()], counts
 
 
 def calculate_failure_entropy(failed_words: List[str]) -> float:
@@ -19,23 +81,106 @@ def calculate_failure_entropy(failed_words: List[str]) -> float:
     Returns:
         float: Entropy value in bits. Returns 0.0 if no failed words.
     """
-    if not failed_words:
-        return 0.0
+    _, letter_counts = count_failure_letters(failed_words)
+    return _letter_entropy(letter_counts)
 
-    # Concatenate all failed words and count letter frequencies
-    all_letters = "".join(failed_words).lower()
-    letter_counts = Counter(all_letters)
-    total_letters = len(all_letters)
+
+def _letter_entropy(letter_counts: ndarray) -> float:
+    """
+    Calculate the Shannon entropy of letter frequencies from per-position counts.
+
+    Args:
+        letter_counts (ndarray): Count of each letter at every position, as
+            returned by count_failure_letters.
+
+    Returns:
+        float: Entropy value in bits. Returns 0.0 if there are no letters.
+    """
+    # Letter totals over all positions, all of them nonzero
+    counts = letter_counts.sum(axis=1)
+    if not counts.size:
+        return 0.0
 
     # Calculate Shannon entropy
-    entropy = 0.0
-    for count in letter_counts.values():
-        probability = count / total_letters
-        entropy -= probability * log2(probability)
+    probabilities = counts / counts.sum()
+    entropy = float(-(probabilities * log2(probabilities)).sum())
 
     return round(entropy, 3)
 
 
+def _group_durations_by_guesses(
+    guess_counts: ndarray, durations_ms: ndarray, won: ndarray
+) -> Dict[int, GuessCountStatistics]:
+    """
+    Calculate duration statistics of all games grouped by number of guesses.
+
+    Args:
+        guess_counts (ndarray): Number of guesses of each game.
+        durations_ms (ndarray): Duration of each game in milliseconds.
+        won (ndarray): Whether each game was won.
+
+    Returns:
+        Dict[int, GuessCountStatistics]: Statistics keyed by number of guesses,
+            in ascending order.
+    """
+    # Sort games by guess count, then duration, so each group is a contiguous
+    # slice already ordered by duration
+    order = lexsort((durations_ms, guess_counts))
+    sorted_durations = durations_ms[order]
+    guess_values, group_starts, group_sizes = unique(
+        guess_counts[order], return_index=True, return_counts=True
+    )
+    group_ends = group_starts + group_sizes - 1
+
+    # Grouped reductions over the contiguous slices
+    wins = add.reduceat(won[order], group_starts, dtype=int64)
+    means = add.reduceat(sorted_durations, group_starts) / group_sizes
+    deviations = sorted_durations - repeat(means, group_sizes)
+    squared_deviations = add.reduceat(deviations * deviations, group_starts)
+
+    # Standard deviation requires at least two data points
+    standard_deviations = sqrt(squared_deviations / maximum(group_sizes - 1, 1))
+    standard_deviations[group_sizes < 2] = 0.0
+
+    # Groups are sorted, so the median averages the middle one or two values
+    medians = (
+        sorted_durations[group_starts + (group_sizes - 1) // 2]
+        + sorted_durations[group_starts + group_sizes // 2]
+    ) / 2
+
+    return {
+        guesses: GuessCountStatistics(
+            total_games=total,
+            wins=group_wins,
+            losses=total - group_wins,
+            mean_duration_ms=mean,
+            median_duration_ms=median_duration,
+            standard_deviation_duration_ms=standard_deviation,
+            min_duration_ms=min_duration,
+            max_duration_ms=max_duration,
+        )
+        for (
+            guesses,
+            total,
+            group_wins,
+            mean,
+            median_duration,
+            standard_deviation,
+            min_duration,
+            max_duration,
+        ) in zip(
+            guess_values.tolist(),
+            group_sizes.tolist(),
+            wins.tolist(),
+            means.tolist(),
+            medians.tolist(),
+            standard_deviations.tolist(),
+            sorted_durations[group_starts].tolist(),
+            sorted_durations[group_ends].tolist(),
+        )
+    }
+
+
 def compute_metrics(batch: BenchmarkBatch) -> PerformanceMetrics:
     """
     Analyze a simulation batch and calculate performance statistics.
@@ -64,21 +209,27 @@ def compute_metrics(batch: BenchmarkBatch) -> PerformanceMetrics:
             failure_entropy=0.0,
         )
 
-    # 1. Filter results
-    wins = [game for game in games if game.won]
-    losses = [game for game in games if not game.won]
+    # 1. Extract per-game fields into arrays once
+    guess_counts = fromiter(
+        (game.number_of_guesses for game in games), dtype=int64, count=total
+    )
+    durations_ns = fromiter(
+        (game.duration_ns for game in games), dtype=int64, count=total
+    )
+    won = fromiter((game.won for game in games), dtype=bool_, count=total)
 
     # 2. Calculate Efficiency (Wins Only)
-    guess_counts = [game.number_of_guesses for game in wins]
+    win_guess_counts = guess_counts[won]
+    wins = win_guess_counts.size
 
-    if guess_counts:
-        mean_guesses = mean(guess_counts)
-        median_guesses = median(guess_counts)
-        max_guesses = max(guess_counts)
+    if wins:
+        mean_guesses = float(win_guess_counts.mean())
+        median_guesses = float(median(win_guess_counts))
+        max_guesses = int(win_guess_counts.max())
 
         # Standard deviation requires at least two data points
-        if len(guess_counts) > 1:
-            standard_deviation_guesses = stdev(guess_counts)
+        if wins > 1:
+            standard_deviation_guesses = float(win_guess_counts.std(ddof=1))
         else:
             standard_deviation_guesses = 0.0
     else:
@@ -89,24 +240,31 @@ def compute_metrics(batch: BenchmarkBatch) -> PerformanceMetrics:
         max_guesses = 0
 
     # 3. Calculate Distribution
-    distribution: Dict[int, int] = {}
-    for count in guess_counts:
-        distribution[count] = distribution.get(count, 0) + 1
-
-    # Sort distribution by keys (1 guess, 2 guesses, etc.)
-    sorted_dist = dict(sorted(distribution.items()))
+    # Keys come out sorted (1 guess, 2 guesses, etc.)
+    distribution = bincount(win_guess_counts)
+    sorted_dist: Dict[int, int] = {
+        guesses: count for guesses, count in enumerate(distribution.tolist()) if count
+    }
 
     # 4. Calculate Time
     # Convert nanoseconds to milliseconds for ease of interpretation
-    average_time_ms = mean([game.duration_ns for game in games]) / 1_000_000
+    average_time_ms = float(durations_ns.mean()) / 1_000_000
+    duration_by_guesses = _group_durations_by_guesses(
+        guess_counts, durations_ns / 1_000_000, won
+    )
 
     # 5. Calculate Failure Entropy
-    failed_word_list = [game.answer for game in losses]
+    # Only the lost games are visited again
+    failed_word_list: List[str] = [
+        game.answer for game in compress(games, logical_not(won).tolist())
+    ]
     entropy = calculate_failure_entropy(failed_word_list)
 
-    return PerformanceMetrics(
+    # Every field is computed above with the declared types, so validation
+    # is skipped
+    return PerformanceMetrics.model_construct(
         total_games=total,
-        win_rate=(len(wins) / total) * 100,
+        win_rate=(wins / total) * 100,
         average_duration_ms=round(average_time_ms, 2),
         solve_efficiency_mean=round(mean_guesses, 3),
         solve_efficiency_median=round(median_guesses, 3),
@@ -115,4 +273,5 @@ def compute_metrics(batch: BenchmarkBatch) -> PerformanceMetrics:
         worst_case_guesses=max_guesses,
         failed_words=failed_word_list,
         failure_entropy=entropy,
+        duration_by_guesses=duration_by_guesses,
     )
@@ -1,11 +1,16 @@
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from logging import getLogger
 from math import ceil
+from os import process_cpu_count
 from statistics import NormalDist
-from typing import Any, Dict, List
+from time import strftime
+from multiprocessing import Queue
+from typing import Any, Dict, Iterable, List
 
 from solver.game.engine import GameEngine
 from solver.game.result import GameResult
+from solver.logging.logger import forward_worker_logs, initialize_worker_logging
 from solver.oracle.base import Oracle
 from solver.settings.game import GameSettings
 from solver.settings.path import PathSettings
@@ -15,7 +20,21 @@ from solver.strategy.base import Solver
 
 logger = getLogger(__name__)
 
+# Standard normal distribution used to derive Z-scores
+_STD_NORMAL = NormalDist()
 
+# Below this many games, worker start-up costs more than it saves
+_PARALLEL_MIN_GAMES = 1000
+
+# Games per independently seeded share of a stateful benchmark. Fixed, so that
+# results do not depend on how many workers play the shares
+_SHARE_SIZE = 128
+
+# Engine of the current benchmark worker process, built by _initialize_worker
+_worker_engine: GameEngine | None = None
+
+
+@lru_cache(maxsize=128)
 def calculate_sample_size(
     confidence_level: float = 0.95,
     margin_of_error: float = 0.01,
@@ -31,6 +50,8 @@ def calculate_sample_size(
         p = estimated proportion (default 0.5 for maximum variance)
         E = margin of error
 
+    Results are memoized, keyed by the exact float values of the arguments.
+
     Args:
         confidence_level: Desired confidence level between 0 and 1 (e.g., 0.95 for 95%).
         margin_of_error: Acceptable margin of error (e.g., 0.01 for ±1%).
@@ -48,7 +69,7 @@ def calculate_sample_size(
         )
 
     # Calculate Z-score dynamically
-    z = NormalDist().inv_cdf((1 + confidence_level) / 2)
+    z = _STD_NORMAL.inv_cdf((1 + confidence_level) / 2)
 
     p = estimated_proportion
     e = margin_of_error
@@ -59,6 +80,167 @@ def calculate_sample_size(
     return ceil(n)
 
 
+def _initialize_worker(
+    game_settings: GameSettings,
+    path_settings: PathSettings,
+    oracle: Oracle,
+    solver: Solver,
+    log_queue: Queue,
+    level: int,
+) -> None:
+    """
+    Build the game engine of a benchmark worker process.
+
+    The feedback table is loaded from the cache written by the parent process,
+    so workers share its memory-mapped pages instead of rebuilding it. Log
+    records are forwarded to the parent process.
+
+    Args:
+        game_settings (GameSettings): Configuration for game rules.
+        path_settings (PathSettings): Configuration for word list paths.
+        oracle (Oracle): Oracle instance for selecting answer words.
+        solver (Solver): Solver instance for generating guesses.
+        log_queue (Queue): Queue read by the parent's log listener.
+        level (int): Level of the parent's root logger.
+    """
+    initialize_worker_logging(log_queue, level)
+
+    global _worker_engine
+    _worker_engine = GameEngine(
+        settings=game_settings,
+        paths=path_settings,
+        chooser=oracle,
+        solver=solver,
+    )
+
+
+def _play_share(
+    engine: GameEngine, first_seed: int, answer_indices: List[int], rng_seed: int
+) -> List[GameResult]:
+    """
+    Play a contiguous share of a benchmark with a freshly seeded solver.
+
+    Args:
+        engine (GameEngine): Engine whose solver plays the games.
+        first_seed (int): Seed recorded for the first game of the share.
+        answer_indices (List[int]): Preselected hidden answer of each game.
+        rng_seed (int): Seed for the solver's random stream in this share.
+
+    Returns:
+        List[GameResult]: Results of the games, in order.
+    """
+    engine.solver.seed(rng_seed)
+
+    return [
+        engine.run(random_seed=first_seed + offset, answer_index=answer_index)
+        for offset, answer_index in enumerate(answer_indices)
+    ]
+
+
+def _run_games(
+    first_seed: int, answer_indices: List[int], rng_seed: int
+) -> List[GameResult]:
+    """
+    Play a contiguous share of a benchmark in a worker process.
+
+    Args:
+        first_seed (int): Seed recorded for the first game of the share.
+        answer_indices (List[int]): Preselected hidden answer of each game.
+        rng_seed (int): Seed for the solver's random stream in this share.
+
+    Returns:
+        List[GameResult]: Results of the games, in order.
+    """
+    return _play_share(_worker_engine, first_seed, answer_indices, rng_seed)
+
+
+def _run_shares(
+    engine: GameEngine,
+    oracle: Oracle,
+    game_settings: GameSettings,
+    path_settings: PathSettings,
+    answer_indices: List[int],
+    workers: int,
+    progress_interval: int,
+) -> List[GameResult]:
+    """
+    Play independent games in fixed-size, independently seeded shares.
+
+    The seed of every share is drawn upfront from the solver's own generator,
+    so a seeded solver gives the same results whether the shares are played
+    in this process or spread across a pool of worker processes.
+
+    Args:
+        engine (GameEngine): Engine used when playing in this process.
+        oracle (Oracle): Oracle instance for selecting answer words.
+        game_settings (GameSettings): Configuration for game rules.
+        path_settings (PathSettings): Configuration for word list paths.
+        answer_indices (List[int]): Preselected hidden answer of each game.
+        workers (int): Number of worker processes, 1 to play in this process.
+        progress_interval (int): Log progress every N games. Set to 0 to disable.
+
+    Returns:
+        List[GameResult]: Results of all games, in order.
+    """
+    number_of_games = len(answer_indices)
+    first_seeds = range(0, number_of_games, _SHARE_SIZE)
+    share_answers = [answer_indices[seed : seed + _SHARE_SIZE] for seed in first_seeds]
+    share_seeds = engine.solver.rng.integers(2**32, size=len(first_seeds)).tolist()
+
+    if workers <= 1:
+        shares = map(
+            partial(_play_share, engine), first_seeds, share_answers, share_seeds
+        )
+        return _collect_shares(shares, number_of_games, progress_interval)
+
+    with (
+        forward_worker_logs() as (log_queue, level),
+        ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_initialize_worker,
+            initargs=(
+                game_settings,
+                path_settings,
+                oracle,
+                engine.solver,
+                log_queue,
+                level,
+            ),
+        ) as executor,
+    ):
+        shares = executor.map(_run_games, first_seeds, share_answers, share_seeds)
+        return _collect_shares(shares, number_of_games, progress_interval)
+
+
+def _collect_shares(
+    shares: Iterable[List[GameResult]], number_of_games: int, progress_interval: int
+) -> List[GameResult]:
+    """
+    Concatenate the results of benchmark shares as they complete, in order.
+
+    Args:
+        shares (Iterable[List[GameResult]]): Results of each share, in order.
+        number_of_games (int): Total number of games, for progress reporting.
+        progress_interval (int): Log progress every N games. Set to 0 to disable.
+
+    Returns:
+        List[GameResult]: Results of all games, in order.
+    """
+    results: List[GameResult] = []
+    for share in shares:
+        completed = len(results)
+        results.extend(share)
+
+        # Progress logging, once per interval crossed
+        if (
+            progress_interval > 0
+            and len(results) // progress_interval > completed // progress_interval
+        ):
+            logger.info(f"Progress: {len(results)}/{number_of_games} games completed")
+
+    return results
+
+
 def run_benchmark(
     oracle: Oracle,
     solver: Solver,
@@ -110,7 +292,7 @@ def run_benchmark(
     )
 
     results: List[GameResult] = []
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = strftime("%Y%m%d_%H%M%S")
 
     # Create engine with the provided oracle and solver
     engine = GameEngine(
@@ -120,28 +302,47 @@ def run_benchmark(
         solver=solver,
     )
 
-    for index in range(number_of_games):
-        # Generate deterministic seed for reproducibility
-        seed = index
+    # Draw every hidden answer upfront in a single oracle call
+    answer_indices = oracle.choose_batch(engine.state.valid_words, number_of_games)
+    workers = process_cpu_count() or 1
+
+    if solver.stateless:
+        # Stateless solvers can simulate every game at once
+        logger.info(f"Simulating {number_of_games} games as a single batch")
+        results = engine.run_batch(
+            random_seeds=list(range(number_of_games)), answer_indices=answer_indices
+        )
 
-        # Run game
-        result = engine.run(random_seed=seed)
-        results.append(result)
+    else:
+        # Games are independent, so large benchmarks are spread across processes
+        if number_of_games < _PARALLEL_MIN_GAMES:
+            workers = 1
+        if workers > 1:
+            logger.info(
+                f"Simulating {number_of_games} games across {workers} processes"
+            )
 
-        # Progress logging
-        if progress_interval > 0 and (index + 1) % progress_interval == 0:
-            logger.info(f"Progress: {index + 1}/{number_of_games} games completed")
+        results = _run_shares(
+            engine=engine,
+            oracle=oracle,
+            game_settings=game_settings,
+            path_settings=path_settings,
+            answer_indices=answer_indices.tolist(),
+            workers=workers,
+            progress_interval=progress_interval,
+        )
 
     logger.info(
         f"Benchmark complete: {strategy_name} - "
         f"{sum(1 for r in results if r.won)}/{number_of_games} wins"
     )
 
-    # Package results into batch
-    return BenchmarkBatch(
+    # Package results into batch, skipping validation of fields built above
+    return BenchmarkBatch.model_construct(
         oracle_name=oracle_name,
         strategy_name=strategy_name,
         timestamp=timestamp,
         settings=settings_snapshot or {},
         games=results,
+        per_game_durations=not solver.stateless,
     )
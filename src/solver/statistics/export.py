@@ -1,20 +1,50 @@
-from collections import defaultdict
 from csv import writer as csv_writer
-from json import dump
+from json import dumps
 from logging import getLogger
 from pathlib import Path
-from statistics import mean, median, stdev
 from typing import Any, List
 
+from numpy import fromiter, int64
+
 from solver.settings.path import PathSettings
 from solver.statistics.aggregator import compute_metrics
 from solver.statistics.models import BenchmarkBatch, PerformanceMetrics
-from solver.statistics.visualizer import plot_batch, plot_batch_comparison
 
 logger = getLogger(__name__)
 
+# Write buffer size for CSV exports, large enough to batch many rows per syscall
+_CSV_BUFFER_SIZE = 1 << 20
+
+# Shown next to durations of batches whose games were simulated together
+_BATCH_DURATION_NOTE = "batch average, games not timed individually"
+
+
+class _FileNameTranslation(dict):
+    """
+    Translation table for ``str.translate`` that replaces every character other
+    than alphanumerics, hyphens and underscores with an underscore.
 
-def save_benchmark_results(batches: List[BenchmarkBatch], paths: PathSettings) -> None:
+    Code points are classified on first use and memoized, so the table covers
+    any Unicode input without being built upfront.
+    """
+
+    def __missing__(self, code_point: int) -> int:
+        character = chr(code_point)
+        if character.isalnum() or character in ("-", "_"):
+            translation = code_point
+        else:
+            translation = ord("_")
+
+        self[code_point] = translation
+        return translation
+
+
+_FILE_NAME_TRANSLATION = _FileNameTranslation()
+
+
+def save_benchmark_results(
+    batches: List[BenchmarkBatch], paths: PathSettings, plot: bool = True
+) -> None:
     """
     Save benchmark results to disk in multiple formats.
 
@@ -22,9 +52,13 @@ def save_benchmark_results(batches: List[BenchmarkBatch], paths: PathSettings) -
     - Individual runs: statistics/runs/{oracle_name}/{solver_name}/{timestamp}/
     - Comparisons: statistics/comparisons/
 
+    Text, CSV and JSON outputs are all written before any plot is rendered, so
+    they are available as soon as possible.
+
     Args:
         batches (List[BenchmarkBatch]): List of benchmark batches to export.
         paths (PathSettings): Global path settings object containing path configurations.
+        plot (bool): Whether to render visualizations (default True).
     """
     if not batches:
         return
@@ -38,6 +72,7 @@ def save_benchmark_results(batches: List[BenchmarkBatch], paths: PathSettings) -
     _create_gitignore(paths.statistics_folder)
 
     # Save individual batch results in organized folders
+    batch_output_directories: List[Path] = []
     for batch, stats in results:
         # Create oracle/solver/timestamp folder structure
         batch_output_directory = (
@@ -47,27 +82,49 @@ def save_benchmark_results(batches: List[BenchmarkBatch], paths: PathSettings) -
             / timestamp
         )
         batch_output_directory.mkdir(parents=True, exist_ok=True)
+        batch_output_directories.append(batch_output_directory)
 
         # Save individual batch files
         _save_batch_summary(batch, stats, batch_output_directory)
-        _save_batch_csv(batch, batch_output_directory)
+        _save_batch_csv(
+            batch, max(stats.duration_by_guesses, default=0), batch_output_directory
+        )
         _save_batch_json(batch, stats, batch_output_directory)
-        _save_performance_stats(batch, batch_output_directory)
-
-        # Generate visualizations for this batch
-        plot_batch(batch, stats, batch_output_directory)
+        _save_performance_stats(stats, batch.per_game_durations, batch_output_directory)
 
     # Save comparison files if multiple batches
+    comparison_directory = paths.statistics_comparisons_folder
     if len(results) > 1:
-        comparison_directory = paths.statistics_comparisons_folder
         comparison_directory.mkdir(parents=True, exist_ok=True)
         _save_comparison_summary(results, comparison_directory, timestamp)
         _save_comparison_json(results, comparison_directory, timestamp)
 
-        # Generate comparison visualizations
-        batches_list = [batch for batch, _ in results]
-        metrics_list = [stats for _, stats in results]
-        plot_batch_comparison(batches_list, metrics_list, comparison_directory)
+    if not plot:
+        return
+
+    # Imported here since the plotting stack is slow to import and only needed now
+    from solver.statistics.visualizer import plot_benchmark_results
+
+    # Generate visualizations once every other output has been written
+    plot_benchmark_results(
+        [batch for batch, _ in results],
+        [stats for _, stats in results],
+        batch_output_directories,
+        comparison_directory,
+    )
+
+
+def _duration_note(batch: BenchmarkBatch) -> str:
+    """
+    Describe how the game durations of a batch were measured, if not per game.
+
+    Args:
+        batch (BenchmarkBatch): Benchmark batch being reported.
+
+    Returns:
+        str: Parenthesized note for batch-averaged durations, otherwise empty.
+    """
+    return "" if batch.per_game_durations else f" ({_BATCH_DURATION_NOTE})"
 
 
 def _sanitize_name(name: str) -> str:
@@ -80,10 +137,7 @@ def _sanitize_name(name: str) -> str:
     Returns:
         Sanitized name with only alphanumeric characters and underscores.
     """
-    return "".join(
-        character if character.isalnum() or character in ("-", "_") else "_"
-        for character in name
-    )
+    return name.translate(_FILE_NAME_TRANSLATION)
 
 
 def _create_gitignore(directory: Path) -> None:
@@ -93,11 +147,16 @@ def _create_gitignore(directory: Path) -> None:
     Args:
         directory (Path): Directory in which to create the .gitignore file.
     """
-    directory.mkdir(parents=True, exist_ok=True)
     gitignore_path = directory / ".gitignore"
-    with open(gitignore_path, "w", encoding="utf-8") as file:
-        file.write("# Automatically created by export script\n")
-        file.write("*\n")
+
+    # Already created by a previous export
+    if gitignore_path.exists():
+        return
+
+    directory.mkdir(parents=True, exist_ok=True)
+    gitignore_path.write_text(
+        "# Automatically created by export script\n*\n", encoding="utf-8"
+    )
 
 
 def _save_batch_summary(
@@ -113,55 +172,65 @@ def _save_batch_summary(
     """
     summary_path = output_directory / "summary.txt"
 
-    with open(summary_path, "w", encoding="utf-8") as file:
-        file.write("=" * 80 + "\n")
-        file.write("WORDLE SOLVER BENCHMARK RESULTS\n")
-        file.write("=" * 80 + "\n\n")
-        file.write(f"Oracle: {batch.oracle_name}\n")
-        file.write(f"Strategy: {batch.strategy_name}\n")
-        file.write(f"Timestamp: {batch.timestamp}\n\n")
-
-        file.write("-" * 80 + "\n")
-        file.write("PERFORMANCE SUMMARY\n")
-        file.write("-" * 80 + "\n")
-        file.write(f"Total games: {stats.total_games}\n")
-        file.write(f"Win rate: {stats.win_rate:.2f}%\n")
-        file.write(f"Avg duration: {stats.average_duration_ms:.2f} ms\n")
-        file.write("\nEfficiency (Wins only):\n")
-        file.write(f"  Mean guesses:   {stats.solve_efficiency_mean:.3f}\n")
-        file.write(f"  Median guesses: {stats.solve_efficiency_median:.1f}\n")
-        file.write(
-            f"  Std Dev:        {stats.solve_efficiency_standard_deviation:.3f}\n"
-        )
-        file.write(f"  Worst case:     {stats.worst_case_guesses} guesses\n")
+    parts: List[str] = []
+    parts.append("=" * 80 + "\n")
+    parts.append("WORDLE SOLVER BENCHMARK RESULTS\n")
+    parts.append("=" * 80 + "\n\n")
+    parts.append(f"Oracle: {batch.oracle_name}\n")
+    parts.append(f"Strategy: {batch.strategy_name}\n")
+    parts.append(f"Timestamp: {batch.timestamp}\n\n")
+
+    parts.append("-" * 80 + "\n")
+    parts.append("PERFORMANCE SUMMARY\n")
+    parts.append("-" * 80 + "\n")
+    parts.append(f"Total games: {stats.total_games}\n")
+    parts.append(f"Win rate: {stats.win_rate:.2f}%\n")
+    parts.append(
+        f"Avg duration: {stats.average_duration_ms:.2f} ms{_duration_note(batch)}\n"
+    )
+    parts.append("\nEfficiency (Wins only):\n")
+    parts.append(f"  Mean guesses:   {stats.solve_efficiency_mean:.3f}\n")
+    parts.append(f"  Median guesses: {stats.solve_efficiency_median:.1f}\n")
+    parts.append(f"  Std Dev:        {stats.solve_efficiency_standard_deviation:.3f}\n")
+    parts.append(f"  Worst case:     {stats.worst_case_guesses} guesses\n")
 
-        file.write("\nGuess Distribution:\n")
-        for num_guesses, count in stats.guess_distribution.items():
-            pct = (count / stats.total_games * 100) if stats.total_games else 0
-            file.write(f"  {num_guesses}: {count} ({pct:.1f}%)\n")
+    parts.append("\nGuess Distribution:\n")
+    for num_guesses, count in stats.guess_distribution.items():
+        pct = (count / stats.total_games * 100) if stats.total_games else 0
+        parts.append(f"  {num_guesses}: {count} ({pct:.1f}%)\n")
+
+    if stats.failed_words:
+        parts.append(f"\nFailed Words ({len(stats.failed_words)}):  \n")
+        parts.extend(f"  {word}\n" for word in stats.failed_words)
 
-        if stats.failed_words:
-            file.write(f"\nFailed Words ({len(stats.failed_words)}):  \n")
-            for word in stats.failed_words:
-                file.write(f"  {word}\n")
+    # Write the whole report at once
+    summary_path.write_text("".join(parts), encoding="utf-8")
 
     logger.info(f"Summary saved to {summary_path}")
 
 
-def _save_batch_csv(batch: BenchmarkBatch, output_directory: Path) -> None:
+def _save_batch_csv(
+    batch: BenchmarkBatch, max_guesses: int, output_directory: Path
+) -> None:
     """
     Generate a detailed CSV file containing raw game data for a single batch.
 
     Args:
         batch (BenchmarkBatch): Benchmark batch to export.
+        max_guesses (int): Maximum number of guesses across all games, won or lost.
         output_directory (Path): Directory to save the CSV.
     """
     csv_path = output_directory / "results.csv"
 
-    # Find maximum number of guesses across all games
-    max_guesses = max((len(game.guesses) for game in batch.games), default=0)
+    # Round every duration to hundredths of a millisecond in integer arithmetic
+    durations_ns = fromiter(
+        (game.duration_ns for game in batch.games), dtype=int64, count=len(batch.games)
+    )
+    durations_ms = ((durations_ns + 5_000) // 10_000 / 100).tolist()
 
-    with open(csv_path, "w", newline="", encoding="utf-8") as file:
+    with open(
+        csv_path, "w", newline="", encoding="utf-8", buffering=_CSV_BUFFER_SIZE
+    ) as file:
         writer = csv_writer(file)
 
         # Build dynamic header with individual guess columns
@@ -169,43 +238,39 @@ def _save_batch_csv(batch: BenchmarkBatch, output_directory: Path) -> None:
         header.extend([f"Guess {i + 1}" for i in range(max_guesses)])
         writer.writerow(header)
 
-        # Write rows with individual guess columns
-        for game in batch.games:
-            row = [
+        # Write rows with individual guess columns, padding with empty strings
+        writer.writerows(
+            [
                 game.answer,
                 game.won,
                 len(game.guesses),
-                round(game.duration_ns / 1_000_000, 2),
+                duration_ms,
                 game.random_seed if game.random_seed is not None else "",
+                *game.guesses,
+                *[""] * (max_guesses - len(game.guesses)),
             ]
-            # Add individual guesses, padding with empty strings
-            row.extend(game.guesses)
-            row.extend([""] * (max_guesses - len(game.guesses)))
-            writer.writerow(row)
+            for game, duration_ms in zip(batch.games, durations_ms)
+        )
 
     logger.info(f"Detailed results saved to {csv_path}")
 
 
-def _save_performance_stats(batch: BenchmarkBatch, output_directory: Path) -> None:
+def _save_performance_stats(
+    stats: PerformanceMetrics, per_game_durations: bool, output_directory: Path
+) -> None:
     """
     Generate a CSV file with performance statistics grouped by guess count.
 
+    When games were not timed individually, only the mean duration is written,
+    since the spread of identical batch-averaged durations means nothing.
+
     Args:
-        batch: Benchmark batch to analyze.
+        stats: Computed performance metrics, including per guess count durations.
+        per_game_durations: Whether each game was timed individually.
         output_directory: Directory to save the performance stats CSV.
     """
     performance_path = output_directory / "performance_by_guesses.csv"
 
-    # Group games by guess count and calculate statistics
-    stats_by_guess = defaultdict(list)
-
-    for game in batch.games:
-        guess_count = len(game.guesses)
-        duration_ms = game.duration_ns / 1_000_000
-        stats_by_guess[guess_count].append(
-            {"duration_ms": duration_ms, "won": game.won}
-        )
-
     with open(performance_path, "w", newline="", encoding="utf-8") as file:
         writer = csv_writer(file)
         writer.writerow(
@@ -222,31 +287,26 @@ def _save_performance_stats(batch: BenchmarkBatch, output_directory: Path) -> No
             ]
         )
 
-        for guess_count in sorted(stats_by_guess.keys()):
-            games_data = stats_by_guess[guess_count]
-            durations = [g["duration_ms"] for g in games_data]
-            wins = sum(1 for g in games_data if g["won"])
-            losses = len(games_data) - wins
-
-            mean_duration = mean(durations)
-            median_duration = median(durations)
-            std_duration = stdev(durations) if len(durations) > 1 else 0.0
-            min_duration = min(durations)
-            max_duration = max(durations)
-
-            writer.writerow(
-                [
-                    guess_count,
-                    len(games_data),
-                    wins,
-                    losses,
-                    f"{mean_duration:.2f}",
-                    f"{median_duration:.2f}",
-                    f"{std_duration:.2f}",
-                    f"{min_duration:.2f}",
-                    f"{max_duration:.2f}",
-                ]
-            )
+        writer.writerows(
+            [
+                guess_count,
+                group.total_games,
+                group.wins,
+                group.losses,
+                f"{group.mean_duration_ms:.2f}",
+                *(
+                    (
+                        f"{group.median_duration_ms:.2f}",
+                        f"{group.standard_deviation_duration_ms:.2f}",
+                        f"{group.min_duration_ms:.2f}",
+                        f"{group.max_duration_ms:.2f}",
+                    )
+                    if per_game_durations
+                    else ("", "", "", "")
+                ),
+            ]
+            for guess_count, group in stats.duration_by_guesses.items()
+        )
 
     logger.info(f"Performance statistics saved to {performance_path}")
 
@@ -275,11 +335,13 @@ def _save_batch_json(
         "strategy": batch.strategy_name,
         "timestamp": batch.timestamp,
         "settings": batch.settings,
+        "per_game_durations": batch.per_game_durations,
         "metrics": stats.model_dump(),
     }
 
     with open(json_path, "w", encoding="utf-8") as file:
-        dump(data, file, indent=2, default=json_serializer)
+        # One-shot dumps uses the C encoder, streaming dump does not
+        file.write(dumps(data, indent=2, default=json_serializer))
 
     logger.info(f"Metrics JSON saved to {json_path}")
 
@@ -299,54 +361,64 @@ def _save_comparison_summary(
     """
     summary_path = output_directory / f"summary_{timestamp}.txt"
 
-    with open(summary_path, "w", encoding="utf-8") as file:
-        file.write("=" * 80 + "\n")
-        file.write("WORDLE SOLVER STRATEGY COMPARISON\n")
-        file.write("=" * 80 + "\n\n")
-        file.write(f"Timestamp: {timestamp}\n")
-        file.write(f"Strategies tested: {len(results)}\n\n")
-
-        # Individual Strategy Details
-        for batch, stats in results:
-            file.write("-" * 80 + "\n")
-            file.write(f"Strategy: {batch.strategy_name}\n")
-            file.write("-" * 80 + "\n")
-            file.write(f"Total games: {stats.total_games}\n")
-            file.write(f"Win rate: {stats.win_rate:.2f}%\n")
-            file.write(f"Avg duration: {stats.average_duration_ms:.2f} ms\n")
-            file.write("\nEfficiency (Wins only):\n")
-            file.write(f"  Mean guesses:   {stats.solve_efficiency_mean:.3f}\n")
-            file.write(f"  Median guesses: {stats.solve_efficiency_median:.1f}\n")
-            file.write(
-                f"  Std Dev:        {stats.solve_efficiency_standard_deviation:.3f}\n"
-            )
-            file.write(f"  Worst case:     {stats.worst_case_guesses} guesses\n")
-
-            file.write("\nGuess Distribution:\n")
-            for num_guesses, count in stats.guess_distribution.items():
-                pct = (count / stats.total_games * 100) if stats.total_games else 0
-                file.write(f"  {num_guesses}: {count} ({pct:.1f}%)\n")
-            file.write("\n")
-
-        # Comparative Table
-        file.write("=" * 80 + "\n")
-        file.write("COMPARISON SUMMARY\n")
-        file.write("=" * 80 + "\n\n")
-
-        header = (
-            f"{'Strategy':<35} {'Win Rate':<10} {'Avg Guesses':<12} {'Time (ms)':<10}\n"
+    parts: List[str] = []
+    parts.append("=" * 80 + "\n")
+    parts.append("WORDLE SOLVER STRATEGY COMPARISON\n")
+    parts.append("=" * 80 + "\n\n")
+    parts.append(f"Timestamp: {timestamp}\n")
+    parts.append(f"Strategies tested: {len(results)}\n\n")
+
+    # Individual Strategy Details
+    for batch, stats in results:
+        parts.append("-" * 80 + "\n")
+        parts.append(f"Strategy: {batch.strategy_name}\n")
+        parts.append("-" * 80 + "\n")
+        parts.append(f"Total games: {stats.total_games}\n")
+        parts.append(f"Win rate: {stats.win_rate:.2f}%\n")
+        parts.append(
+            f"Avg duration: {stats.average_duration_ms:.2f} ms{_duration_note(batch)}\n"
         )
-        file.write(header)
-        file.write("-" * 80 + "\n")
-
-        for batch, stats in results:
-            line = (
-                f"{batch.strategy_name:<35} "
-                f"{stats.win_rate:>6.2f}%   "
-                f"{stats.solve_efficiency_mean:>8.3f}    "
-                f"{stats.average_duration_ms:>8.2f}\n"
-            )
-            file.write(line)
+        parts.append("\nEfficiency (Wins only):\n")
+        parts.append(f"  Mean guesses:   {stats.solve_efficiency_mean:.3f}\n")
+        parts.append(f"  Median guesses: {stats.solve_efficiency_median:.1f}\n")
+        parts.append(
+            f"  Std Dev:        {stats.solve_efficiency_standard_deviation:.3f}\n"
+        )
+        parts.append(f"  Worst case:     {stats.worst_case_guesses} guesses\n")
+
+        parts.append("\nGuess Distribution:\n")
+        for num_guesses, count in stats.guess_distribution.items():
+            pct = (count / stats.total_games * 100) if stats.total_games else 0
+            parts.append(f"  {num_guesses}: {count} ({pct:.1f}%)\n")
+        parts.append("\n")
+
+    # Comparative Table
+    parts.append("=" * 80 + "\n")
+    parts.append("COMPARISON SUMMARY\n")
+    parts.append("=" * 80 + "\n\n")
+
+    header = (
+        f"{'Strategy':<35} {'Win Rate':<10} {'Avg Guesses':<12} {'Time (ms)':<10}\n"
+    )
+    parts.append(header)
+    parts.append("-" * 80 + "\n")
+
+    for batch, stats in results:
+        line = (
+            f"{batch.strategy_name:<35} "
+            f"{stats.win_rate:>6.2f}%   "
+            f"{stats.solve_efficiency_mean:>8.3f}    "
+            f"{stats.average_duration_ms:>8.2f}"
+            f"{'' if batch.per_game_durations else '*'}\n"
+        )
+        parts.append(line)
+
+    # Batch-averaged times are not comparable with individually timed games
+    if not all(batch.per_game_durations for batch, _ in results):
+        parts.append(f"\n* {_BATCH_DURATION_NOTE.capitalize()}.\n")
+
+    # Write the whole report at once
+    summary_path.write_text("".join(parts), encoding="utf-8")
 
     logger.info(f"Comparison summary saved to {summary_path}")
 
@@ -386,11 +458,13 @@ def _save_comparison_json(
         strategy_data = {
             "name": batch.strategy_name,
             "settings": batch.settings,
+            "per_game_durations": batch.per_game_durations,
             "metrics": stats.model_dump(),
         }
         data["strategies"].append(strategy_data)
 
     with open(json_path, "w", encoding="utf-8") as file:
-        dump(data, file, indent=2, default=json_serializer)
+        # One-shot dumps uses the C encoder, streaming dump does not
+        file.write(dumps(data, indent=2, default=json_serializer))
 
     logger.info(f"Comparison JSON saved to {json_path}")
@@ -15,6 +15,9 @@ class BenchmarkBatch(BaseModel):
         timestamp (str): ISO formatted timestamp of the run.
         settings (Dict[str, Any]): Snapshot of the game/solver settings used.
         games (List[GameResult]): List of game results.
+        per_game_durations (bool): Whether each game was timed individually. If
+            False, the games were simulated together and each one records an
+            even share of the total batch time.
     """
 
     oracle_name: str = Field(..., description="Name of the oracle strategy used.")
@@ -24,6 +27,9 @@ class BenchmarkBatch(BaseModel):
         default_factory=dict, description="Snapshot of the game/solver settings used."
     )
     games: List[GameResult] = Field(..., description="List of game results.")
+    per_game_durations: bool = Field(
+        default=True, description="Whether each game was timed individually."
+    )
 
     @property
     def total_games(self) -> int:
@@ -36,6 +42,39 @@ class BenchmarkBatch(BaseModel):
         return len(self.games)
 
 
+class GuessCountStatistics(BaseModel):
+    """
+    Duration statistics for all games that ended after the same number of guesses.
+
+    Attributes:
+        total_games (int): Number of games that took this many guesses.
+        wins (int): Number of those games that were won.
+        losses (int): Number of those games that were lost.
+        mean_duration_ms (float): Mean game time in milliseconds.
+        median_duration_ms (float): Median game time in milliseconds.
+        standard_deviation_duration_ms (float): Standard deviation of game time.
+        min_duration_ms (float): Shortest game time in milliseconds.
+        max_duration_ms (float): Longest game time in milliseconds.
+    """
+
+    total_games: int = Field(..., description="Games that took this many guesses.")
+    wins: int = Field(..., description="Games won with this many guesses.")
+    losses: int = Field(..., description="Games lost with this many guesses.")
+    mean_duration_ms: float = Field(..., description="Mean game time in milliseconds.")
+    median_duration_ms: float = Field(
+        ..., description="Median game time in milliseconds."
+    )
+    standard_deviation_duration_ms: float = Field(
+        ..., description="Standard deviation of game time in milliseconds."
+    )
+    min_duration_ms: float = Field(
+        ..., description="Shortest game time in milliseconds."
+    )
+    max_duration_ms: float = Field(
+        ..., description="Longest game time in milliseconds."
+    )
+
+
 class PerformanceMetrics(BaseModel):
     """
     Aggregated statistics derived from a BenchmarkBatch.
@@ -51,6 +90,8 @@ class PerformanceMetrics(BaseModel):
         worst_case_guesses (int): Max guesses taken in any winning game.
         failed_words (List[str]): List of answer words that resulted in a loss.
         failure_entropy (float): Shannon entropy of letter frequencies in failed words.
+        duration_by_guesses (Dict[int, GuessCountStatistics]): Duration statistics
+            of all games grouped by number of guesses. Excluded from serialization.
     """
 
     # --- High Level Stats ---
@@ -86,3 +127,10 @@ class PerformanceMetrics(BaseModel):
         default=0.0,
         description="Shannon entropy of letter frequencies in failed words (bits).",
     )
+
+    # --- Export Helpers ---
+    duration_by_guesses: Dict[int, GuessCountStatistics] = Field(
+        default_factory=dict,
+        exclude=True,
+        description="Duration statistics of all games grouped by number of guesses.",
+    )
@@ -1,23 +1,41 @@
-from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from logging import getLogger
+from os import process_cpu_count
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, List, Tuple
 
-import matplotlib.pyplot as plt
+import matplotlib
 import numpy as np
 import pandas as pd
 import seaborn as sns
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
-from solver.statistics.aggregator import calculate_failure_entropy
+from solver.logging.logger import forward_worker_logs, initialize_worker_logging
+from solver.statistics.aggregator import count_failure_letters
 from solver.statistics.models import BenchmarkBatch, PerformanceMetrics
 
 logger = getLogger(__name__)
 
+# Only image files are produced, so skip interactive GUI backends
+matplotlib.use("Agg")
+
 # Global visualization settings
 sns.set_theme(style="whitegrid", palette="muted")
-plt.rcParams["figure.dpi"] = 300
-plt.rcParams["savefig.dpi"] = 300
-plt.rcParams["font.size"] = 10
+matplotlib.rcParams["figure.dpi"] = 300
+matplotlib.rcParams["savefig.dpi"] = 300
+matplotlib.rcParams["font.size"] = 10
+
+# Maximum number of points drawn for per-game line plots
+_MAX_PLOT_POINTS = 5000
+
+# Fewest plots worth rendering in worker processes. Each worker spends about
+# 0.85 s importing the plotting stack, while one plot takes 0.4 to 0.5 s, so
+# the pool only pays off once it saves several renders
+_PARALLEL_MIN_PLOTS = 8
+
+# A plotting function together with the arguments to render one image
+PlotTask = Tuple[Callable[..., None], Tuple[Any, ...]]
 
 
 def plot_guess_distribution_comparison(
@@ -33,27 +51,35 @@ def plot_guess_distribution_comparison(
         metrics_list (List[PerformanceMetrics]): Corresponding metrics for each batch.
         output_path (Path): Path where the plot image will be saved.
     """
-    figure, axis = plt.subplots(figsize=(12, 6))
+    figure = Figure(figsize=(12, 6))
+    FigureCanvasAgg(figure)  # Layout and saving share the Agg renderer
+    axis = figure.subplots()
 
     # Collect all possible guess counts across all strategies
     all_guess_counts = set()
     for metrics in metrics_list:
         all_guess_counts.update(metrics.guess_distribution.keys())
 
-    guess_counts = sorted(all_guess_counts)
-    x_positions = np.arange(len(guess_counts))
+    guess_counts = np.array(sorted(all_guess_counts), dtype=np.int64)
+    x_positions = np.arange(guess_counts.size)
     bar_width = 0.8 / len(batches)  # Dynamic width based on number of strategies
+    offsets = (np.arange(len(batches)) - len(batches) / 2) * bar_width + bar_width / 2
+
+    # Dense (strategy, guess count) frequency matrix, zero where a strategy
+    # never solved in that many guesses
+    frequencies = np.zeros((len(batches), guess_counts.size), dtype=np.int64)
+    for row, metrics in zip(frequencies, metrics_list):
+        distribution = metrics.guess_distribution
+        keys = np.fromiter(distribution.keys(), dtype=np.int64, count=len(distribution))
+        row[np.searchsorted(guess_counts, keys)] = np.fromiter(
+            distribution.values(), dtype=np.int64, count=len(distribution)
+        )
 
     # Plot bars for each strategy
-    for index, (batch, metrics) in enumerate(zip(batches, metrics_list)):
-        frequencies = [
-            metrics.guess_distribution.get(guess_count, 0)
-            for guess_count in guess_counts
-        ]
-        offset = (index - len(batches) / 2) * bar_width + bar_width / 2
+    for batch, offset, row in zip(batches, offsets, frequencies):
         axis.bar(
             x_positions + offset,
-            frequencies,
+            row,
             bar_width,
             label=f"{batch.strategy_name}",
             alpha=0.8,
@@ -71,9 +97,8 @@ def plot_guess_distribution_comparison(
     axis.legend(title="Strategy", frameon=True)
     axis.grid(axis="y", alpha=0.3)
 
-    plt.tight_layout()
-    plt.savefig(output_path, bbox_inches="tight")
-    plt.close()
+    figure.tight_layout()
+    figure.savefig(output_path, bbox_inches="tight")
 
     logger.info(f"Guess distribution comparison saved to {output_path}")
 
@@ -95,39 +120,21 @@ def plot_failure_mode_heatmap(
         logger.info(f"No failures to visualize for {strategy_name}")
         return
 
-    # Create position-based letter frequency matrix
-    word_length = 5
-    letter_frequencies = {position: Counter() for position in range(word_length)}
-
-    for word in metrics.failed_words:
-        word = word.upper()
-        for position, letter in enumerate(word[:word_length]):
-            letter_frequencies[position][letter] += 1
-
-    # Convert to DataFrame for heatmap
-    all_letters = sorted(
-        set(
-            letter
-            for position_counter in letter_frequencies.values()
-            for letter in position_counter
-        )
-    )
-    frequency_matrix = []
-    for letter in all_letters:
-        row = [
-            letter_frequencies[position].get(letter, 0)
-            for position in range(word_length)
-        ]
-        frequency_matrix.append(row)
+    # Position-based letter frequencies
+    letters, frequency_matrix = count_failure_letters(metrics.failed_words)
 
+    # Pandas wraps the contiguous count array without copying
     dataframe = pd.DataFrame(
         frequency_matrix,
-        index=all_letters,
-        columns=[f"Position {i + 1}" for i in range(word_length)],
+        index=[letter.upper() for letter in letters],
+        columns=[f"Position {i + 1}" for i in range(frequency_matrix.shape[1])],
+        copy=False,
     )
 
     # Create heatmap
-    figure, axis = plt.subplots(figsize=(8, 10))
+    figure = Figure(figsize=(8, 10))
+    FigureCanvasAgg(figure)  # Layout and saving share the Agg renderer
+    axis = figure.subplots()
     sns.heatmap(
         dataframe,
         annot=True,
@@ -144,8 +151,8 @@ def plot_failure_mode_heatmap(
     axis.set_xlabel("Letter Position", fontweight="bold")
     axis.set_ylabel("Letter", fontweight="bold")
 
-    # Add entropy score as subtitle
-    entropy_score = calculate_failure_entropy(metrics.failed_words)
+    # Add entropy score as subtitle, as computed during aggregation
+    entropy_score = metrics.failure_entropy
     axis.text(
         0.5,
         -0.15,
@@ -158,9 +165,8 @@ def plot_failure_mode_heatmap(
         bbox=dict(boxstyle="round", facecolor="wheat", alpha=0.5),
     )
 
-    plt.tight_layout()
+    figure.tight_layout()
     figure.savefig(output_path, bbox_inches="tight")
-    plt.close()
 
     logger.info(f"Failure mode heatmap saved to {output_path}")
 
@@ -181,19 +187,28 @@ def plot_cumulative_winrate(
         return
 
     # Calculate cumulative win rate at each game
-    cumulative_wins = 0
-    win_rate_history = []
-
-    for index, game in enumerate(games_list, start=1):
-        if game.won:
-            cumulative_wins += 1
-        win_rate_history.append((cumulative_wins / index) * 100)
-
-    figure, axis = plt.subplots(figsize=(12, 6))
-    axis.plot(range(1, len(games_list) + 1), win_rate_history, linewidth=1.5, alpha=0.8)
+    number_of_games = len(games_list)
+    game_numbers = np.arange(1, number_of_games + 1)
+    wins = np.fromiter(
+        (game.won for game in games_list), dtype=np.int64, count=number_of_games
+    )
+    win_rate_history = np.cumsum(wins) / game_numbers * 100
+
+    # Thin large batches to at most _MAX_PLOT_POINTS points, always keeping the
+    # first and last games; the stride is rounded up so the bound holds
+    last_game = number_of_games - 1
+    stride = max(1, -(-last_game // (_MAX_PLOT_POINTS - 1)))
+    plotted = np.append(np.arange(0, last_game, stride), last_game)
+
+    figure = Figure(figsize=(12, 6))
+    FigureCanvasAgg(figure)  # Layout and saving share the Agg renderer
+    axis = figure.subplots()
+    axis.plot(
+        game_numbers[plotted], win_rate_history[plotted], linewidth=1.5, alpha=0.8
+    )
 
     # Add final win rate as horizontal reference line
-    final_win_rate = win_rate_history[-1]
+    final_win_rate = float(win_rate_history[-1])
     axis.axhline(
         final_win_rate,
         color="red",
@@ -213,9 +228,8 @@ def plot_cumulative_winrate(
     axis.grid(alpha=0.3)
     axis.set_ylim([0, 105])
 
-    plt.tight_layout()
+    figure.tight_layout()
     figure.savefig(output_path, bbox_inches="tight")
-    plt.close()
 
     logger.info(f"Cumulative win rate plot saved to {output_path}")
 
@@ -231,31 +245,150 @@ def plot_batch(
         metrics (PerformanceMetrics): Pre-computed performance metrics.
         output_directory (Path): Directory where plots will be saved.
     """
+    _render(_batch_plot_tasks(batch, metrics, output_directory))
+
+
+def plot_batch_comparison(
+    batches: List[BenchmarkBatch],
+    metrics_list: List[PerformanceMetrics],
+    output_directory: Path,
+) -> None:
+    """
+    Generate comparison visualizations across multiple batches.
+
+    Args:
+        batches (List[BenchmarkBatch]): List of benchmark batches to compare.
+        metrics_list (List[PerformanceMetrics]): Corresponding metrics for each batch.
+        output_directory (Path): Directory where comparison plots will be saved.
+    """
+    _render(_comparison_plot_tasks(batches, metrics_list, output_directory))
+
+
+def plot_benchmark_results(
+    batches: List[BenchmarkBatch],
+    metrics_list: List[PerformanceMetrics],
+    batch_output_directories: List[Path],
+    comparison_directory: Path,
+) -> None:
+    """
+    Generate the visualizations of every batch, plus the comparison plots when
+    there are several batches.
+
+    Every image is independent, so they are rendered in parallel across a
+    pool of worker processes when more than one CPU is available.
+
+    Args:
+        batches (List[BenchmarkBatch]): Benchmark batches to visualize.
+        metrics_list (List[PerformanceMetrics]): Corresponding metrics for each batch.
+        batch_output_directories (List[Path]): Output directory of each batch.
+        comparison_directory (Path): Directory where comparison plots will be saved.
+    """
+    tasks: List[PlotTask] = []
+    for batch, metrics, output_directory in zip(
+        batches, metrics_list, batch_output_directories
+    ):
+        tasks.extend(_batch_plot_tasks(batch, metrics, output_directory))
+
+    if len(batches) > 1:
+        tasks.extend(
+            _comparison_plot_tasks(batches, metrics_list, comparison_directory)
+        )
+
+    _render(tasks)
+
+
+def _batch_plot_tasks(
+    batch: BenchmarkBatch, metrics: PerformanceMetrics, output_directory: Path
+) -> List[PlotTask]:
+    """
+    List the plots of a single benchmark batch, creating its output directory.
+
+    Args:
+        batch (BenchmarkBatch): Benchmark batch to visualize.
+        metrics (PerformanceMetrics): Pre-computed performance metrics.
+        output_directory (Path): Directory where plots will be saved.
+
+    Returns:
+        List[PlotTask]: Plotting functions and their arguments.
+    """
     output_directory.mkdir(parents=True, exist_ok=True)
-    plot_cumulative_winrate(batch, output_directory / "convergence.png")
+    tasks: List[PlotTask] = [
+        (plot_cumulative_winrate, (batch, output_directory / "convergence.png"))
+    ]
 
     if metrics.failed_words:
-        plot_failure_mode_heatmap(
-            metrics, batch.strategy_name, output_directory / "failure_heatmap.png"
+        tasks.append(
+            (
+                plot_failure_mode_heatmap,
+                (
+                    metrics,
+                    batch.strategy_name,
+                    output_directory / "failure_heatmap.png",
+                ),
+            )
         )
 
+    return tasks
 
-def plot_batch_comparison(
+
+def _comparison_plot_tasks(
     batches: List[BenchmarkBatch],
     metrics_list: List[PerformanceMetrics],
     output_directory: Path,
-) -> None:
+) -> List[PlotTask]:
     """
-    Generate comparison visualizations across multiple batches.
+    List the comparison plots across batches, creating their output directory.
 
     Args:
         batches (List[BenchmarkBatch]): List of benchmark batches to compare.
         metrics_list (List[PerformanceMetrics]): Corresponding metrics for each batch.
         output_directory (Path): Directory where comparison plots will be saved.
+
+    Returns:
+        List[PlotTask]: Plotting functions and their arguments.
     """
     output_directory.mkdir(parents=True, exist_ok=True)
-    plot_guess_distribution_comparison(
-        batches,
-        metrics_list,
-        output_directory / "guess_distribution_comparison.png",
-    )
+    return [
+        (
+            plot_guess_distribution_comparison,
+            (
+                batches,
+                metrics_list,
+                output_directory / "guess_distribution_comparison.png",
+            ),
+        )
+    ]
+
+
+def _render(tasks: List[PlotTask]) -> None:
+    """
+    Render plots, in parallel worker processes when that can help.
+
+    Below _PARALLEL_MIN_PLOTS plots, or with a single CPU, the worker start-up
+    costs more than it saves, so the plots are rendered in the current process
+    instead.
+
+    Args:
+        tasks (List[PlotTask]): Plotting functions and their arguments.
+    """
+    workers = min(process_cpu_count() or 1, len(tasks))
+    if workers <= 1 or len(tasks) < _PARALLEL_MIN_PLOTS:
+        for function, arguments in tasks:
+            function(*arguments)
+        return
+
+    with (
+        forward_worker_logs() as (log_queue, level),
+        ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=initialize_worker_logging,
+            initargs=(log_queue, level),
+        ) as executor,
+    ):
+        futures = [
+            executor.submit(function, *arguments) for function, arguments in tasks
+        ]
+
+        # Surface the first rendering error, if any
+        for future in futures:
+            future.result()
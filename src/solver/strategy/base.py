@@ -1,18 +1,53 @@
 from abc import ABC, abstractmethod
+from typing import ClassVar, List, Optional
+
+from numpy import ndarray
+from numpy.random import Generator, default_rng
 
 from solver.game.state import GameState
 
 
+# Number of random draws generated at once and consumed one per guess
+_DRAW_BUFFER_SIZE: int = 64
+
+# Upper bound of each buffered draw, large enough that reducing it modulo a
+# word pool size has negligible bias
+_DRAW_BOUND: int = 1 << 30
+
+
 class Solver(ABC):
     """
     Base interface for any Wordle solving strategy.
 
     A strategy receives the current GameState and must return
-    a valid 5-letter guess word.
+    the index of a valid 5-letter guess word in the word bank.
+
+    Attributes:
+        rng (Generator): Random number generator of the solver. Deterministic
+            solvers can simply leave it unused.
+        stateless (bool): Whether guesses ignore the game history. Stateless
+            solvers implement ``batch_guess`` so that many games can be
+            simulated at once.
     """
 
+    __slots__ = ("rng", "_draws", "_draw_position")
+
+    stateless: ClassVar[bool] = False
+
+    def __init__(self, rng_seed: Optional[int] = None) -> None:
+        """
+        Initialize the solver with optional deterministic randomness.
+
+        Args:
+            rng_seed (Optional[int]): Optional seed used to initialize the random
+                number generator for reproducible guess selection.
+        """
+        self.rng: Generator = default_rng(rng_seed)
+        self._draws: List[int] = []
+        self._draw_position: int = 0
+
     @abstractmethod
-    def guess(self, state: GameState) -> str:
+    def guess(self, state: GameState) -> int:
         """
         Produce the next guess based on the current game state.
 
@@ -20,7 +55,7 @@ class Solver(ABC):
             state (GameState): Current game state snapshot.
 
         Returns:
-            str: A valid 5-letter lowercase guess.
+            int: Index of the guessed word in state.word_bank.
         """
         ...
 
@@ -30,3 +65,58 @@ class Solver(ABC):
         Reset any internal solver state for a new game.
         """
         ...
+
+    def seed(self, rng_seed: int) -> None:
+        """
+        Reseed the random number generator, dropping any buffered draws.
+
+        Used to give each independently simulated share of a benchmark its
+        own random stream.
+
+        Args:
+            rng_seed (int): Seed for the random number generator.
+        """
+        self.rng = default_rng(rng_seed)
+        self._draws = []
+        self._draw_position = 0
+
+    def _next_draw(self) -> int:
+        """
+        Take the next random draw, refilling the buffer when it runs out.
+
+        Draws are generated in blocks so that the cost of calling into the
+        generator is shared by many guesses.
+
+        Returns:
+            int: A random integer in ``[0, 2**30)``.
+        """
+        if self._draw_position == len(self._draws):
+            self._draws = self.rng.integers(
+                _DRAW_BOUND, size=_DRAW_BUFFER_SIZE
+            ).tolist()
+            self._draw_position = 0
+
+        draw = self._draws[self._draw_position]
+        self._draw_position += 1
+        return draw
+
+    def batch_guess(self, state: GameState, size: int) -> ndarray:
+        """
+        Produce one guess for each of many independent games at once.
+
+        Only stateless solvers support this, since the guesses cannot depend
+        on the history of any individual game.
+
+        Args:
+            state (GameState): Game state holding the shared word pools.
+            size (int): Number of guesses to produce.
+
+        Returns:
+            ndarray: Word bank indices of the guesses, one per game.
+
+        Raises:
+            NotImplementedError: If the solver does not support batch guessing.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support batch guessing."
+        )
@@ -1,5 +1,6 @@
-from random import Random
-from typing import List, Optional
+from typing import Optional
+
+from numpy import arange, compress, count_nonzero, empty, equal, int32, ndarray
 
 from solver.game.state import GameState
 from solver.strategy.base import Solver
@@ -9,11 +10,19 @@ class RandomConsistentSolver(Solver):
     """
     Random Consistent Guess solver.
 
-    This solver maintains a candidate set of all words that are consistent
-    with the feedback received so far and selects uniformly at random from
-    this set.
+    This solver maintains a candidate set of the indices of all answer words
+    that are consistent with the feedback received so far and selects
+    uniformly at random from this set.
     """
 
+    __slots__ = (
+        "candidates",
+        "_processed_turns",
+        "_match_buffer",
+        "_candidate_buffer",
+        "_full_pool",
+    )
+
     def __init__(self, rng_seed: Optional[int] = None) -> None:
         """
         Initialize the solver with optional deterministic randomness.
@@ -22,12 +31,14 @@ class RandomConsistentSolver(Solver):
             rng_seed (Optional[int]): Optional seed used to initialize the random number
                 generator for reproducible guess selection.
         """
-        super().__init__()
-        self.random: Random = Random(rng_seed)
-        self.candidates: Optional[List[str]] = None
+        super().__init__(rng_seed)
+        self.candidates: Optional[ndarray] = None
         self._processed_turns: int = 0
+        self._match_buffer: Optional[ndarray] = None
+        self._candidate_buffer: Optional[ndarray] = None
+        self._full_pool: Optional[ndarray] = None
 
-    def guess(self, state: GameState) -> str:
+    def guess(self, state: GameState) -> int:
         """
         Produce a guess based on the current game state.
 
@@ -35,14 +46,20 @@ class RandomConsistentSolver(Solver):
             state (GameState): Current game state.
 
         Returns:
-            str: A guessed word.
+            int: Word bank index of the guessed word.
         """
-        self._update_candidates(state)
-
+        # Every game starts from the shared, read-only array of all answers
         if self.candidates is None:
-            self.candidates = state.valid_words.copy()
+            pool_size = len(state.valid_words)
+            if self._full_pool is None or self._full_pool.size != pool_size:
+                self._full_pool = arange(pool_size, dtype=int32)
+                self._full_pool.flags.writeable = False
+            self.candidates = self._full_pool
 
-        return self.random.choice(self.candidates)
+        self._update_candidates(state)
+
+        candidate = self.candidates[self._next_draw() % self.candidates.size]
+        return state.valid_word_bank_index[candidate.item()]
 
     def _update_candidates(self, state: GameState) -> None:
         """
@@ -55,26 +72,52 @@ class RandomConsistentSolver(Solver):
             state (GameState): Current game state containing history and word pools.
         """
         # Nothing new to process
-        if len(state.history) == self._processed_turns:
+        if state.turn == self._processed_turns:
             return
 
-        # Initialize candidates if necessary
-        if self.candidates is None:
-            self.candidates = state.valid_words.copy()
-
-        last_guess, last_feedback = state.history[-1]
+        last_guess, last_feedback = state.history[state.turn - 1].tolist()
 
-        guess_index = state.word_bank_index[last_guess]
+        # Contiguous row of feedback for the last guess against every answer
+        feedback_row = state.feedback_encode_table[last_guess]
 
-        self.candidates = [
-            word
-            for word in self.candidates
-            if state.feedback_encode_table[guess_index][state.valid_word_index[word]]
-            == last_feedback
-        ]
+        if self.candidates.size == feedback_row.size:
+            self._filter_full_pool(feedback_row, last_feedback)
+        else:
+            # Keep the candidates that would have produced the same feedback
+            self.candidates = self.candidates[
+                feedback_row[self.candidates] == last_feedback
+            ]
 
         self._processed_turns += 1
 
+    def _filter_full_pool(self, feedback_row: ndarray, last_feedback: int) -> None:
+        """
+        Filter the full answer pool into preallocated buffers.
+
+        The first filter of every game is by far the largest, so its match mask
+        and surviving indices are written into buffers reused across games.
+        Since every answer is still a candidate, the feedback row is compared
+        directly without gathering it first. Later, smaller filters allocate
+        their results, which is cheaper than the extra calls needed to write
+        into buffers.
+
+        Args:
+            feedback_row (ndarray): Feedback of the last guess against every answer.
+            last_feedback (int): Encoded feedback received for the last guess.
+        """
+        if self._match_buffer is None or self._match_buffer.size != feedback_row.size:
+            self._match_buffer = empty(feedback_row.size, dtype=bool)
+            self._candidate_buffer = empty(feedback_row.size, dtype=int32)
+
+        equal(feedback_row, last_feedback, out=self._match_buffer)
+        matches = count_nonzero(self._match_buffer)
+
+        self.candidates = compress(
+            self._match_buffer,
+            self.candidates,
+            out=self._candidate_buffer[:matches],
+        )
+
     def reset(self) -> None:
         """
         Reset solver internal state for a new game.
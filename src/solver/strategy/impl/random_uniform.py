@@ -1,5 +1,6 @@
-from random import Random
-from typing import Optional
+from typing import ClassVar, Optional
+
+from numpy import asarray, ndarray
 
 from solver.game.state import GameState
 from solver.strategy.base import Solver
@@ -12,8 +13,15 @@ class RandomUniformSolver(Solver):
     The solver can optionally choose from either:
         - The full word bank (all allowed guesses), or
         - The valid answer pool only.
+
+    Guesses never depend on feedback, so the solver is stateless and supports
+    batch guessing.
     """
 
+    __slots__ = ("choose_from_answers",)
+
+    stateless: ClassVar[bool] = True
+
     def __init__(
         self, rng_seed: Optional[int] = None, choose_from_answers: bool = False
     ) -> None:
@@ -27,11 +35,10 @@ class RandomUniformSolver(Solver):
                 answer list only. Otherwise, guesses are sampled from the
                 entire word bank (all allowed guesses).
         """
-        super().__init__()
-        self.random: Random = Random(rng_seed)
+        super().__init__(rng_seed)
         self.choose_from_answers: bool = choose_from_answers
 
-    def guess(self, state: GameState) -> str:
+    def guess(self, state: GameState) -> int:
         """
         Select and return a random guess word.
 
@@ -39,12 +46,30 @@ class RandomUniformSolver(Solver):
             state: Current game state containing word pools.
 
         Returns:
-            str: A randomly selected guess word.
+            int: Word bank index of a randomly selected guess word.
+        """
+        if self.choose_from_answers:
+            pool = state.valid_word_bank_index
+            return pool[self._next_draw() % len(pool)]
+
+        return self._next_draw() % len(state.word_bank)
+
+    def batch_guess(self, state: GameState, size: int) -> ndarray:
+        """
+        Select a random guess word for each of many games at once.
+
+        Args:
+            state: Current game state containing word pools.
+            size: Number of guesses to produce.
+
+        Returns:
+            ndarray: Word bank indices of the randomly selected guess words.
         """
         if self.choose_from_answers:
-            return self.random.choice(state.valid_words)
+            pool = asarray(state.valid_word_bank_index)
+            return pool[self.rng.integers(pool.size, size=size)]
 
-        return self.random.choice(state.word_bank)
+        return self.rng.integers(len(state.word_bank), size=size)
 
     def reset(self) -> None:
         """
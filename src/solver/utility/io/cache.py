@@ -1,24 +1,57 @@
-from hashlib import sha256
+from functools import lru_cache
+from hashlib import blake2b
+from mmap import ACCESS_READ, mmap
 from pathlib import Path
-from pickle import HIGHEST_PROTOCOL, dump, load
-from typing import Any, Optional
+from tempfile import NamedTemporaryFile
+from typing import Optional
 
+from numpy import load as load_array, ndarray, save as save_array
 
-def _compute_file_hash(file: Path) -> str:
+
+def _compute_file_hash(file: Path) -> bytes:
     """
-    Compute SHA256 hash of a file's contents.
+    Compute a BLAKE2b fingerprint of a file's contents.
+
+    Fingerprints are memoized per process by resolved path, modification time
+    and size, so unchanged files are only read and hashed once.
 
     Args:
         file (Path): Path to the file.
 
     Returns:
-        str: Hexadecimal hash string.
+        bytes: Raw digest bytes.
+    """
+    file_stat = file.stat()
+    return _compute_file_hash_cached(
+        str(file.resolve()), file_stat.st_mtime_ns, file_stat.st_size
+    )
+
+
+@lru_cache(maxsize=128)
+def _compute_file_hash_cached(file: str, mtime_ns: int, size: int) -> bytes:
     """
-    sha256_hash = sha256()
-    with open(file, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256_hash.update(chunk)
-    return sha256_hash.hexdigest()
+    Compute a BLAKE2b fingerprint of a file's contents.
+
+    The hash only identifies content for caching, so a fast non-security hash
+    with a 128-bit digest is sufficient. The file is memory-mapped and hashed
+    in a single call, without a Python-level read loop. The modification time
+    is not used directly; it is part of the memoization key.
+
+    Args:
+        file (str): Resolved path to the file.
+        mtime_ns (int): Modification time of the file in nanoseconds.
+        size (int): Size of the file in bytes.
+
+    Returns:
+        bytes: Raw digest bytes.
+    """
+    file_hash = blake2b(digest_size=16)
+
+    # Empty files cannot be memory-mapped, and have nothing to hash
+    if size:
+        with open(file, "rb") as f, mmap(f.fileno(), 0, access=ACCESS_READ) as mapped:
+            file_hash.update(mapped)
+    return file_hash.digest()
 
 
 def get_cache_key(*files: Path) -> str:
@@ -31,42 +64,59 @@ def get_cache_key(*files: Path) -> str:
     Returns:
         str: Combined hash key.
     """
-    combined = "".join(_compute_file_hash(file_path) for file_path in files)
-    return sha256(combined.encode()).hexdigest()
+    combined_hash = blake2b(digest_size=16)
+    for file_path in files:
+        combined_hash.update(_compute_file_hash(file_path))
+    return combined_hash.hexdigest()
 
 
-def load_from_cache(cache_directory: Path, cache_key: str) -> Optional[Any]:
+def load_array_from_cache(cache_directory: Path, cache_key: str) -> Optional[ndarray]:
     """
-    Load cached data if it exists.
+    Load a cached NumPy array as a read-only memory map if it exists.
+
+    The array is not read into memory up front: pages are loaded on first
+    access and shared between processes mapping the same file.
 
     Args:
         cache_directory (Path): Directory containing cache files.
         cache_key (str): Unique identifier for this cache entry.
 
     Returns:
-        Cached data if found, otherwise None.
+        Read-only memory-mapped array if found, otherwise None.
     """
-    cache_file = cache_directory / f"{cache_key}.pkl"
+    cache_file = cache_directory / f"{cache_key}.npy"
     if cache_file.exists():
         try:
-            with open(cache_file, "rb") as f:
-                return load(f)
+            return load_array(cache_file, mmap_mode="r", allow_pickle=False)
         except Exception:
             # If cache is corrupted, ignore it
             return None
     return None
 
 
-def save_to_cache(cache_directory: Path, cache_key: str, data: Any) -> None:
+def save_array_to_cache(cache_directory: Path, cache_key: str, array: ndarray) -> None:
     """
-    Save data to cache.
+    Save a NumPy array to cache in ``.npy`` format.
+
+    The file is written under a unique temporary name in the same directory
+    and then moved into place, so concurrent readers never map a partially
+    written array and concurrent writers never share a temporary file.
 
     Args:
         cache_directory (Path): Directory to store cache files.
         cache_key (str): Unique identifier for this cache entry.
-        data (Any): Data to cache.
+        array (ndarray): Array to cache.
     """
     cache_directory.mkdir(parents=True, exist_ok=True)
-    cache_file = cache_directory / f"{cache_key}.pkl"
-    with open(cache_file, "wb") as f:
-        dump(data, f, protocol=HIGHEST_PROTOCOL)
+    cache_file = cache_directory / f"{cache_key}.npy"
+    with NamedTemporaryFile(
+        dir=cache_directory, prefix=f"{cache_key}.", suffix=".tmp", delete=False
+    ) as f:
+        temporary_file = Path(f.name)
+        try:
+            save_array(f, array, allow_pickle=False)
+        except BaseException:
+            f.close()
+            temporary_file.unlink(missing_ok=True)
+            raise
+    temporary_file.replace(cache_file)